@@ -23,12 +23,15 @@ Was neu ist (gegenüber dem alten "Random Question" Paw-Quiz):
 - Vor/Zurück-Navigation: beantwortete Fragen sind durchscrollbar
 """
 
+import gzip
 import hashlib
 import json
 import mimetypes
 import os
+import pickle
 import random
 import re
+import sys
 import time
 import uuid
 from functools import lru_cache
@@ -36,9 +39,20 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import quote
 
-from flask import Flask, Response, jsonify, make_response, render_template_string, request, send_file
+from flask import Flask, Response, jsonify, request, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 
+try:  # optional: schneller JSON-Parser (C), Fallback auf stdlib json
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:  # optional: Brotli-Varianten für HTML/CSS/JS, sonst nur gzip
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
 
 # ------------------------------------------------------------
 # 0) META / LINKS
@@ -46,12 +60,6 @@ from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
 
 LANDING_URL = "https://data-tales.dev/"
 
-SERVICES = [
-    ("Worm Attack 3000", "https://worm-attack-3000.data-tales.dev/"),
-    ("PAW Wiki", "https://paw-wiki.data-tales.dev/"),
-    ("WizardQuiz", "https://wizard-quiz.data-tales.dev/"),
-]
-
 SERVICE_META = {
     "service_name_slug": "paw-quiz",
     "page_title": "PAW  Quiz",
@@ -70,11 +78,27 @@ ID_RE = re.compile(r"^[a-z0-9-]{1,80}$")
 TOKEN_RE = re.compile(r"^[A-Za-z0-9._-]{20,8000}$")
 MEDIA_PATH_RE = re.compile(r"^[A-Za-z0-9_\-./]{1,220}$")
 
+# gebundene Matcher (spart Attribut-Lookup in den Validierungen pro Request)
+_id_ok = ID_RE.fullmatch
+_token_ok = TOKEN_RE.match
+_media_path_ok = MEDIA_PATH_RE.fullmatch
+
 # Run-Token lange gültig (Fortsetzen)
 RUN_TOKEN_MAX_AGE_S = int(os.getenv("RUN_TOKEN_MAX_AGE_S", str(30 * 24 * 60 * 60)))
 
+# Bilder ändern sich nie (Dateiname = Charakter-ID) -> lange cachen
+MEDIA_MAX_AGE_S = 30 * 24 * 60 * 60
+# CSS/JS tragen ihren Content-Hash im Dateinamen -> unbegrenzt cachebar
+STATIC_MAX_AGE_S = 365 * 24 * 60 * 60
+
+# Hinter nginx/Apache: Auslieferung per X-Sendfile an den Proxy abgeben
+USE_X_SENDFILE = os.getenv("USE_X_SENDFILE", "").strip().lower() in {"1", "true", "yes"}
+
 EXCLUDE_PROFILE_KEYS = {"Stimme (US/Kanada)", "Stimme (UK)"}
 
+# Abgeleiteter Index (valid/eligible/levels) kann zwischengespeichert werden (opt-in per INDEX_CACHE_DIR)
+INDEX_CACHE_VERSION = "3"
+
 APP_DIR = Path(__file__).resolve().parent
 
 
@@ -87,6 +111,12 @@ def _resolve_path(p: str) -> Path:
 
 DATA_JSON_PATH = _resolve_path(os.getenv("DATA_JSON_PATH", "out_pawpatrol_characters/characters_de.json"))
 DATA_BASE_DIR = _resolve_path(os.getenv("DATA_BASE_DIR", "out_pawpatrol_characters"))
+# nur aktiv, wenn gesetzt: ein Treffer überspringt die is_file()-Prüfung der Bilder
+_INDEX_CACHE_DIR_ENV = os.getenv("INDEX_CACHE_DIR", "").strip()
+INDEX_CACHE_DIR = _resolve_path(_INDEX_CACHE_DIR_ENV) if _INDEX_CACHE_DIR_ENV else None
+# einmal auflösen statt pro Media-Request (resolve() = stat-Kette)
+DATA_BASE_RESOLVED = DATA_BASE_DIR.resolve()
+_DATA_BASE_PREFIX = str(DATA_BASE_RESOLVED) + os.sep
 
 
 class QuizDataError(Exception):
@@ -117,6 +147,9 @@ def _derive_secret_from_dataset_bytes(all_bytes: bytes) -> str:
 
 
 def _make_serializer(secret: str) -> URLSafeTimedSerializer:
+    # URLSafe*Serializer komprimiert den kompakten JSON-Payload bereits per zlib,
+    # sobald das kleiner wird (Token beginnt dann mit "."); ein Run-Token schrumpft
+    # so von ~1,3 KB JSON auf ~0,7 KB. Eigene Kompression davor bringt nichts mehr.
     return URLSafeTimedSerializer(secret_key=secret, salt="paw-quiz-v2")
 
 
@@ -126,7 +159,7 @@ def _token_dumps(s: URLSafeTimedSerializer, kind: str, payload: Dict[str, Any])
 
 
 def _token_loads(s: URLSafeTimedSerializer, token: str, kind: str, max_age_s: int) -> Dict[str, Any]:
-    if not isinstance(token, str) or not TOKEN_RE.match(token):
+    if not isinstance(token, str) or not _token_ok(token):
         raise QuizDataError("Ungültiges Token-Format.")
     obj = s.loads(token, max_age=max_age_s)
     if not isinstance(obj, dict) or obj.get("k") != kind or not isinstance(obj.get("p"), dict):
@@ -142,23 +175,46 @@ def _nonempty_profile_flat(pf: Any) -> bool:
     return isinstance(pf, dict) and any(str(k).strip() and str(v).strip() for k, v in pf.items())
 
 
+@lru_cache(maxsize=4096)
 def _safe_media_path(rel_path: str) -> Path:
     """Resolve rel_path under DATA_BASE_DIR and prevent path traversal."""
-    if not rel_path or not MEDIA_PATH_RE.fullmatch(rel_path) or rel_path.startswith("/") or ".." in rel_path:
+    if not rel_path or not _media_path_ok(rel_path) or rel_path.startswith("/") or ".." in rel_path:
         raise ValueError("invalid media path")
 
-    base = DATA_BASE_DIR.resolve()
-    target = (DATA_BASE_DIR / rel_path).resolve()
-    if base not in target.parents and target != base:
+    target = (DATA_BASE_RESOLVED / rel_path).resolve()
+    if not str(target).startswith(_DATA_BASE_PREFIX) and target != DATA_BASE_RESOLVED:
         raise ValueError("media path traversal blocked")
     return target
 
 
+@lru_cache(maxsize=2048)
+def _resolve_media(rel_path: str) -> Optional[Path]:
+    """Validierter Pfad einer existierenden Datei, sonst None (Datenset ist zur Laufzeit fix)."""
+    fp = _safe_media_path(rel_path)
+    if not fp.is_file():
+        return None
+    return fp
+
+
+@lru_cache(maxsize=2048)
+def _media_validators(fp: Path) -> Tuple[str, float]:
+    """(ETag, mtime) einer Mediendatei – Basis für 304-Antworten ohne Datei-Zugriff."""
+    st = fp.stat()
+    return f"{st.st_mtime_ns:x}-{st.st_size:x}", st.st_mtime
+
+
+@lru_cache(maxsize=256)
+def _guess_mime(suffix: str) -> str:
+    mime, _ = mimetypes.guess_type("x" + suffix)
+    return mime or "application/octet-stream"
+
+
 @lru_cache(maxsize=1)
 def load_dataset() -> Dict[str, Any]:
     if not DATA_JSON_PATH.exists():
         raise FileNotFoundError(f"Dataset JSON not found: {DATA_JSON_PATH}")
-    obj = json.loads(DATA_JSON_PATH.read_text(encoding="utf-8"))
+    raw = DATA_JSON_PATH.read_bytes()
+    obj = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
     if not isinstance(obj, dict):
         raise ValueError("Dataset root must be an object")
     chars = obj.get("characters")
@@ -167,8 +223,78 @@ def load_dataset() -> Dict[str, Any]:
     return obj
 
 
+@lru_cache(maxsize=1)
+def _media_dirs_stamp() -> str:
+    """mtimes des Datenordners + direkter Unterordner (ändern sich beim Anlegen/Löschen/Umbenennen von Bildern)."""
+    parts = []
+    try:
+        parts.append(str(DATA_BASE_RESOLVED.stat().st_mtime_ns))
+        with os.scandir(DATA_BASE_RESOLVED) as it:
+            for e in sorted(it, key=lambda e: e.name):
+                if e.is_dir():
+                    parts.append(f"{e.name}:{e.stat().st_mtime_ns}")
+    except OSError:
+        return ""
+    return ",".join(parts)
+
+
+def _index_cache_file() -> Optional[Path]:
+    """Cache-Datei für den abgeleiteten Index, Schlüssel = Datenset + Bildordner + Secret + Regeln."""
+    if INDEX_CACHE_DIR is None:
+        return None
+    try:
+        raw = DATA_JSON_PATH.read_bytes()
+    except Exception:
+        return None
+    key = "|".join([
+        INDEX_CACHE_VERSION,
+        str(QUESTIONS_PER_LEVEL),
+        str(UNKNOWN_LIMIT),
+        ",".join(sorted(EXCLUDE_PROFILE_KEYS)),
+        str(DATA_BASE_RESOLVED),
+        _media_dirs_stamp(),
+        _dataset_secret(),
+    ]).encode("utf-8")
+    return INDEX_CACHE_DIR / f"index-{_sha256_hex(raw + b'::' + key)}.pkl"
+
+
+@lru_cache(maxsize=1)
+def _cached_index() -> Optional[Dict[str, Any]]:
+    """Index aus einem früheren Prozessstart (spart JSON-Parse + stat() aller Bilder)."""
+    fp = _index_cache_file()
+    if fp is None or not fp.is_file():
+        return None
+    try:
+        with fp.open("rb") as f:
+            idx = pickle.load(f)
+    except Exception:
+        return None
+    if not isinstance(idx, dict) or not all(k in idx for k in ("valid", "eligible", "levels")):
+        return None
+    return idx
+
+
+def _store_index(valid: List[Dict[str, Any]], eligible: List[Dict[str, Any]], levels: List[Dict[str, Any]]) -> None:
+    fp = _index_cache_file()
+    if fp is None or fp.is_file():
+        return
+    try:
+        fp.parent.mkdir(parents=True, exist_ok=True)
+        tmp = fp.with_name(f"{fp.name}.{uuid.uuid4().hex}.tmp")
+        with tmp.open("wb") as f:
+            pickle.dump({"valid": valid, "eligible": eligible, "levels": levels}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, fp)
+    except Exception:
+        # Cache ist optional (z. B. read-only Dateisystem)
+        pass
+
+
 @lru_cache(maxsize=1)
 def get_valid_characters() -> List[Dict[str, Any]]:
+    idx = _cached_index()
+    if idx is not None:
+        return idx["valid"]
+
     ds = load_dataset()
     out: List[Dict[str, Any]] = []
     for ch in ds.get("characters", []):
@@ -180,7 +306,7 @@ def get_valid_characters() -> List[Dict[str, Any]]:
         img = ch.get("image", {}) if isinstance(ch.get("image"), dict) else {}
         src = ch.get("source", {}) if isinstance(ch.get("source"), dict) else {}
 
-        if not cid or not ID_RE.fullmatch(cid):
+        if not cid or not _id_ok(cid):
             continue
         if not name:
             continue
@@ -200,15 +326,25 @@ def get_valid_characters() -> List[Dict[str, Any]]:
         if not img_path.exists() or not img_path.is_file():
             continue
 
+        pf_clean = _filter_profile_flat(pf)
         out.append(
             {
                 "id": cid,
                 "name": name,
                 "image_rel": rel_img,
-                "profile_flat": pf if isinstance(pf, dict) else {},
+                "image_url": f"/media/{quote(rel_img)}",
+                "profile_flat": pf_clean,  # bereits getrimmt/gefiltert
+                "unknown_n": _unknown_count(pf_clean),
+                # JSON-fertig; wird unverändert in jede Frage-Payload übernommen
                 "source": {
-                    "page_url": str(src.get("page_url", "")).strip(),
                     "attribution": str(src.get("attribution", "")).strip(),
+                    "page_url": str(src.get("page_url", "")).strip(),
+                    "page_title": str(src.get("page_title", "")).strip(),
+                    "text_license_default": str(src.get("text_license_default", "")).strip(),
+                    "text_license_url": str(src.get("text_license_url", "")).strip(),
+                    "retrieved_at": str(src.get("retrieved_at", "")).strip(),
+                    "revision_id": src.get("revision_id"),
+                    "revision_timestamp": str(src.get("revision_timestamp", "")).strip(),
                 },
             }
         )
@@ -218,6 +354,18 @@ def get_valid_characters() -> List[Dict[str, Any]]:
     return out
 
 
+@lru_cache(maxsize=1)
+def _name_map() -> Dict[str, str]:
+    """id -> Anzeigename (einmal berechnet statt pro Frage)."""
+    return {c["id"]: c["name"] for c in get_valid_characters()}
+
+
+@lru_cache(maxsize=1)
+def _char_index() -> Dict[str, Dict[str, Any]]:
+    """id -> Charakter-Record für O(1)-Lookups."""
+    return {c["id"]: c for c in get_valid_characters()}
+
+
 def _filter_profile_flat(pf: Dict[str, Any]) -> Dict[str, str]:
     clean: Dict[str, str] = {}
     for k, v in pf.items():
@@ -227,24 +375,25 @@ def _filter_profile_flat(pf: Dict[str, Any]) -> Dict[str, str]:
         vv = str(v).strip()
         if not vv:
             continue
-        clean[kk] = vv
+        # dieselben Labels ("Spezies", "Geschlecht", …) in allen Charakteren -> einmal im Speicher
+        clean[sys.intern(kk)] = vv
     return clean
 
 
-def _unknown_count(pf: Dict[str, Any]) -> int:
-    pf_clean = _filter_profile_flat(pf)
-    n = 0
-    for v in pf_clean.values():
-        if str(v).strip().lower() == "unbekannt":
-            n += 1
-    return n
+def _unknown_count(pf_clean: Dict[str, str]) -> int:
+    """Erwartet bereits gefiltertes profile_flat (siehe _filter_profile_flat)."""
+    return sum(1 for v in pf_clean.values() if v.lower() == "unbekannt")
 
 
 @lru_cache(maxsize=1)
 def get_eligible_characters() -> List[Dict[str, Any]]:
     """Nur Charaktere mit < UNKNOWN_LIMIT 'Unbekannt' in profile_flat."""
+    idx = _cached_index()
+    if idx is not None:
+        return idx["eligible"]
+
     chars = get_valid_characters()
-    eligible = [c for c in chars if _unknown_count(c.get("profile_flat", {})) < UNKNOWN_LIMIT]
+    eligible = [c for c in chars if c["unknown_n"] < UNKNOWN_LIMIT]
     if len(eligible) < 3:
         raise QuizDataError(
             f"Zu wenig geeignete Charaktere (>=3 benötigt). "
@@ -253,6 +402,12 @@ def get_eligible_characters() -> List[Dict[str, Any]]:
     return eligible
 
 
+@lru_cache(maxsize=1)
+def _eligible_ids() -> Tuple[str, ...]:
+    """Eindeutige IDs aller eligible Charaktere (Distraktor-Pool)."""
+    return tuple(dict.fromkeys(c["id"] for c in get_eligible_characters()))
+
+
 @lru_cache(maxsize=1)
 def _dataset_secret() -> str:
     try:
@@ -264,10 +419,15 @@ def _dataset_secret() -> str:
 
 SERIALIZER = _make_serializer(_dataset_secret())
 
+# SHA-256-Zustand nach "<secret>::" einmal berechnen; pro Seed nur noch copy() + update()
+_SEED_HASHER = hashlib.sha256((_dataset_secret() + "::").encode("utf-8"))
+
 
 def _stable_rng(seed_parts: List[str]) -> random.Random:
     s = "|".join(seed_parts).encode("utf-8", errors="ignore")
-    h = hashlib.sha256((_dataset_secret() + "::").encode("utf-8") + s).digest()
+    hasher = _SEED_HASHER.copy()
+    hasher.update(s)
+    h = hasher.digest()
     seed_int = int.from_bytes(h[:8], "big", signed=False)
     return random.Random(seed_int)
 
@@ -275,6 +435,10 @@ def _stable_rng(seed_parts: List[str]) -> random.Random:
 @lru_cache(maxsize=1)
 def get_levels() -> List[Dict[str, Any]]:
     """Compute dynamic levels from eligible characters."""
+    idx = _cached_index()
+    if idx is not None:
+        return idx["levels"]
+
     eligible = get_eligible_characters()
     n = len(eligible)
     # mindestens ein Level
@@ -310,9 +474,11 @@ def get_levels() -> List[Dict[str, Any]]:
                 "title": f"Level {lv}",
                 "questions": QUESTIONS_PER_LEVEL,
                 "character_ids": [c["id"] for c in chunk],
+                "characters": tuple(chunk),  # Records direkt, kein by_id-Lookup in _build_run
             }
         )
 
+    _store_index(get_valid_characters(), eligible, levels)
     return levels
 
 
@@ -325,32 +491,37 @@ def _validate_level(level: Any) -> int:
 
 
 def _find_character(cid: str) -> Optional[Dict[str, Any]]:
-    if not ID_RE.fullmatch(cid):
-        return None
-    for c in get_valid_characters():
-        if c["id"] == cid:
-            return c
-    return None
+    # Index enthält nur IDs, die beim Laden gegen ID_RE geprüft wurden
+    return _char_index().get(cid)
+
+
+def _pick_distractors(rng: random.Random, ids: Tuple[str, ...], cid: str) -> Tuple[str, str]:
+    """2 zufällige IDs != cid per Index-Ziehung (ohne O(N)-Kopie des Pools)."""
+    picked: List[str] = []
+    while len(picked) < 2:
+        x = ids[rng.randrange(len(ids))]
+        if x != cid and x not in picked:
+            picked.append(x)
+    return picked[0], picked[1]
 
 
-def _build_run(level: int) -> Dict[str, Any]:
+def _build_run(level: int, now: int) -> Dict[str, Any]:
     levels = get_levels()
     lv_def = levels[level - 1]
-    eligible = get_eligible_characters()
-    eligible_ids = [c["id"] for c in eligible]
-    by_id = {c["id"]: c for c in eligible}
+    eligible_ids = _eligible_ids()
 
-    rng = random.SystemRandom()
+    # 2 Distraktoren aus eligible (nicht korrekt)
+    if len(eligible_ids) < 3:
+        raise QuizDataError("Zu wenig Distraktoren im Datenset (>=2 benötigt).")
+
+    # Distraktoren sind nicht sicherheitskritisch (Token ist signiert):
+    # einmal aus os.urandom seeden, danach Mersenne Twister ohne Syscalls
+    rng = random.Random(int.from_bytes(os.urandom(8), "big"))
 
     qspecs: List[Dict[str, Any]] = []
-    for cid in lv_def["character_ids"]:
-        if cid not in by_id:
-            continue
-        # 2 Distraktoren aus eligible (nicht korrekt)
-        distractors = [x for x in eligible_ids if x != cid]
-        if len(distractors) < 2:
-            raise QuizDataError("Zu wenig Distraktoren im Datenset (>=2 benötigt).")
-        d1, d2 = rng.sample(distractors, 2)
+    for ch in lv_def["characters"]:
+        cid = ch["id"]
+        d1, d2 = _pick_distractors(rng, eligible_ids, cid)
 
         opt_ids = [cid, d1, d2]
         rng.shuffle(opt_ids)
@@ -364,8 +535,9 @@ def _build_run(level: int) -> Dict[str, Any]:
         "v": 1,
         "rid": uuid.uuid4().hex,
         "lvl": level,
-        "t0": int(time.time()),
+        "t0": now,
         "score": 0,
+        "cn": 0,  # Anzahl richtiger Antworten
         "next": 0,  # index der nächsten unbeantworteten Frage
         "qs": qspecs,  # [{cid, opt:[...]}]
         "ans": [None] * QUESTIONS_PER_LEVEL,  # selected option-id
@@ -375,13 +547,15 @@ def _build_run(level: int) -> Dict[str, Any]:
 
 
 def _state_from_run(runp: Dict[str, Any], view_pos: int) -> Dict[str, Any]:
+    # runp ist normalisiert (_build_run / _validate_run_token)
+    nxt = runp["next"]
     return {
-        "level": runp.get("lvl"),
+        "level": runp["lvl"],
         "pos": view_pos,
-        "next": runp.get("next"),
+        "next": nxt,
         "total": QUESTIONS_PER_LEVEL,
-        "score": runp.get("score"),
-        "done": int(runp.get("next", 0)) >= QUESTIONS_PER_LEVEL,
+        "score": runp["score"],
+        "done": nxt >= QUESTIONS_PER_LEVEL,
     }
 
 
@@ -399,7 +573,7 @@ def _question_payload(runp: Dict[str, Any], pos: int) -> Dict[str, Any]:
         raise QuizDataError("Charakter nicht gefunden.")
 
     # options -> names
-    name_map = {c["id"]: c["name"] for c in get_valid_characters()}
+    name_map = _name_map()
     options = [{"id": oid, "text": name_map.get(oid, oid)} for oid in opt_ids]
 
     answered = runp["ans"][pos] is not None
@@ -411,50 +585,45 @@ def _question_payload(runp: Dict[str, Any], pos: int) -> Dict[str, Any]:
         "idx": pos + 1,
         "pos": pos,
         "total": QUESTIONS_PER_LEVEL,
-        "image_url": f"/media/{quote(ch['image_rel'])}",
+        "image_url": ch["image_url"],
         "options": options,
         "answered": answered,
         "selected_id": selected_id,
         "correct_id": correct_id,
         "correct": correct,
+        "next_image_url": None,
     }
 
+    # Bild der Folgefrage, damit der Client es schon während des Lesens laden kann
+    if pos + 1 < len(qs):
+        nxt = _find_character(qs[pos + 1]["cid"])
+        if nxt:
+            payload["next_image_url"] = nxt["image_url"]
+
     # Quelle IMMER mitsenden (auch vor Beantwortung)
-    src = ch.get("source", {}) if isinstance(ch.get("source"), dict) else {}
-    src_attrib = str(src.get("attribution", "")).strip()
-    src_page_url = str(src.get("page_url", "")).strip()
-
-    payload["source"] = {
-        "attribution": src_attrib,
-        "page_url": src_page_url,
-        "page_title": str(src.get("page_title", "")).strip(),
-        "text_license_default": str(src.get("text_license_default", "")).strip(),
-        "text_license_url": str(src.get("text_license_url", "")).strip(),
-        "retrieved_at": str(src.get("retrieved_at", "")).strip(),
-        "revision_id": src.get("revision_id"),
-        "revision_timestamp": str(src.get("revision_timestamp", "")).strip(),
-    }
+    src = ch["source"]
+    payload["source"] = src
     # Fallback-Felder für ältere JS-Versionen
-    payload["attribution"] = src_attrib
-    payload["page_url"] = src_page_url
+    payload["attribution"] = src["attribution"]
+    payload["page_url"] = src["page_url"]
 
     return payload
 
 
-def _summary_from_run(runp: Dict[str, Any]) -> Dict[str, Any]:
-    duration_s = max(0, int(time.time()) - int(runp.get("t0", int(time.time()))))
-    correct_n = sum(1 for x in runp.get("ok", []) if x is True)
+def _summary_from_run(runp: Dict[str, Any], now: int) -> Dict[str, Any]:
+    duration_s = max(0, now - runp["t0"])
+    correct_n = runp["cn"]  # wird in api_run_answer mitgezählt
     accuracy = float(correct_n) / float(QUESTIONS_PER_LEVEL)
     return {
-        "level": runp.get("lvl"),
-        "score": int(runp.get("score", 0)),
-        "correct_n": int(correct_n),
+        "level": runp["lvl"],
+        "score": runp["score"],
+        "correct_n": correct_n,
         "accuracy": accuracy,
         "duration_s": duration_s,
     }
 
 
-def _validate_run_token(run_token: str) -> Dict[str, Any]:
+def _validate_run_token(run_token: str, now: int) -> Dict[str, Any]:
     try:
         runp = _token_loads(SERIALIZER, run_token, "run", max_age_s=RUN_TOKEN_MAX_AGE_S)
     except SignatureExpired as e:
@@ -482,7 +651,9 @@ def _validate_run_token(run_token: str) -> Dict[str, Any]:
     runp["lvl"] = _safe_int(runp.get("lvl"), 1)
     runp["score"] = _safe_int(runp.get("score"), 0)
     runp["next"] = nxt
-    runp["t0"] = _safe_int(runp.get("t0"), int(time.time()))
+    runp["t0"] = _safe_int(runp.get("t0"), now)
+    # ältere Tokens ohne Zähler: einmalig aus ok[] ableiten
+    runp["cn"] = _safe_int(runp["cn"], 0) if "cn" in runp else sum(1 for x in runp["ok"] if x is True)
     return runp
 
 
@@ -492,6 +663,7 @@ def _update_run_token(runp: Dict[str, Any]) -> str:
     runp["score"] = int(runp["score"])
     runp["next"] = int(runp["next"])
     runp["t0"] = int(runp["t0"])
+    runp["cn"] = int(runp["cn"])
     return _token_dumps(SERIALIZER, "run", runp)
 
 
@@ -499,18 +671,44 @@ def _update_run_token(runp: Dict[str, Any]) -> str:
 # 3) APP
 # ------------------------------------------------------------
 
-app = Flask(__name__)
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify/request.get_json über orjson statt stdlib json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode("utf-8")
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+app = Flask(__name__, static_folder=None)
+app.config["USE_X_SENDFILE"] = USE_X_SENDFILE
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
 
 # ------------------------------------------------------------
 # 4) ROUTES (API)
 # ------------------------------------------------------------
 
+_HEALTH_OK_BODY = b'{"ok":true}'
+
+
+@lru_cache(maxsize=1)
+def _levels_body() -> Tuple[bytes, str]:
+    """Fertig serialisierte /api/levels-Antwort + ETag (Datenset ist zur Laufzeit fix)."""
+    levels = get_levels()
+    out = [{"level": lv["level"], "title": lv["title"], "questions": lv["questions"]} for lv in levels]
+    eligible_total = len(get_eligible_characters())
+    body = app.json.dumps({"ok": True, "levels": out, "eligible_total": eligible_total}).encode("utf-8")
+    return body, _sha256_hex(body)[:32]
+
+
 @app.get("/api/health")
 def api_health() -> Response:
     try:
         _ = get_levels()
-        return jsonify({"ok": True})
+        return Response(_HEALTH_OK_BODY, mimetype="application/json")
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)[:240]}), 500
 
@@ -518,12 +716,13 @@ def api_health() -> Response:
 @app.get("/api/levels")
 def api_levels() -> Response:
     try:
-        levels = get_levels()
-        out = [{"level": lv["level"], "title": lv["title"], "questions": lv["questions"]} for lv in levels]
-        eligible_total = len(get_eligible_characters())
-        return jsonify({"ok": True, "levels": out, "eligible_total": eligible_total})
+        body, etag = _levels_body()
     except Exception as e:
         return jsonify({"ok": False, "error": str(e)}), 500
+    resp = Response(body, mimetype="application/json")
+    resp.set_etag(etag)
+    resp.headers["Cache-Control"] = "no-cache"  # immer revalidieren -> 304 statt Body
+    return resp.make_conditional(request)
 
 
 @app.post("/api/run/start")
@@ -535,7 +734,7 @@ def api_run_start() -> Response:
 
     try:
         level = _validate_level(body.get("level"))
-        runp = _build_run(level)
+        runp = _build_run(level, now=int(time.time()))
         run_token = _update_run_token(runp)
         q = _question_payload(runp, 0)
         st = _state_from_run(runp, view_pos=0)
@@ -559,13 +758,14 @@ def api_run_resume() -> Response:
         return _json_error("run fehlt", 400)
 
     try:
-        runp = _validate_run_token(run_token)
+        now = int(time.time())
+        runp = _validate_run_token(run_token, now)
         # View pos: last answered (next-1) or 0
         view_pos = max(0, int(runp["next"]) - 1) if int(runp["next"]) > 0 else 0
         q = _question_payload(runp, view_pos)
         st = _state_from_run(runp, view_pos=view_pos)
         done = bool(st["done"])
-        summary = _summary_from_run(runp) if done else None
+        summary = _summary_from_run(runp, now) if done else None
         return jsonify({"ok": True, "updated_run": _update_run_token(runp), "state": st, "question": q, "done": done, "summary": summary})
     except QuizDataError as e:
         return _json_error(str(e), 400)
@@ -585,7 +785,8 @@ def api_run_question() -> Response:
         return _json_error("run fehlt", 400)
 
     try:
-        runp = _validate_run_token(run_token)
+        now = int(time.time())
+        runp = _validate_run_token(run_token, now)
 
         # darf maximal bis "next" (erste unbeantwortete) navigieren
         if pos < 0 or pos > int(runp["next"]):
@@ -593,6 +794,11 @@ def api_run_question() -> Response:
         if pos >= QUESTIONS_PER_LEVEL:
             return _json_error("Ungültige Frage-Position.", 400)
 
+        if pos == 0 and int(runp["next"]) == 0:
+            # Laufzeit ab Anzeige der ersten Frage: vorab gestartete Runs (Client startet auf
+            # dem Ergebnis-Screen spekulativ) sollen die Lesezeit davor nicht mitzählen
+            runp["t0"] = now
+
         q = _question_payload(runp, pos)
         st = _state_from_run(runp, view_pos=pos)
         return jsonify({"ok": True, "updated_run": _update_run_token(runp), "state": st, "question": q})
@@ -613,11 +819,12 @@ def api_run_answer() -> Response:
 
     if not run_token:
         return _json_error("run fehlt", 400)
-    if not ID_RE.fullmatch(choice_id):
+    if not _id_ok(choice_id):
         return _json_error("Ungültige Auswahl.", 400)
 
     try:
-        runp = _validate_run_token(run_token)
+        now = int(time.time())
+        runp = _validate_run_token(run_token, now)
 
         if pos != int(runp["next"]):
             # Nur die nächste offene Frage darf beantwortet werden (kein Überspringen / keine Änderungen)
@@ -639,6 +846,7 @@ def api_run_answer() -> Response:
         runp["ok"][pos] = bool(is_correct)
         if is_correct:
             runp["score"] = int(runp.get("score", 0)) + 1
+            runp["cn"] = int(runp["cn"]) + 1
 
         runp["next"] = int(runp["next"]) + 1
 
@@ -648,7 +856,7 @@ def api_run_answer() -> Response:
         q = _question_payload(runp, pos)
         st = _state_from_run(runp, view_pos=pos)
         done = bool(st["done"])
-        summary = _summary_from_run(runp) if done else None
+        summary = _summary_from_run(runp, now) if done else None
 
         return jsonify({"ok": True, "updated_run": updated, "state": st, "question": q, "done": done, "summary": summary})
 
@@ -663,13 +871,29 @@ def api_run_answer() -> Response:
 @app.get("/media/<path:rel_path>")
 def media(rel_path: str):
     try:
-        fp = _safe_media_path(rel_path)
-        if not fp.exists() or not fp.is_file():
+        fp = _resolve_media(rel_path)
+        if fp is None:
             return jsonify({"ok": False, "error": "not_found"}), 404
 
-        mime, _ = mimetypes.guess_type(str(fp))
-        resp = make_response(send_file(fp, mimetype=mime or "application/octet-stream"))
-        resp.headers["Cache-Control"] = "public, max-age=2592000, immutable"
+        cache_control = f"public, max-age={MEDIA_MAX_AGE_S}, immutable"
+        etag, mtime = _media_validators(fp)
+        if request.if_none_match.contains(etag):
+            resp = Response(status=304)
+            resp.set_etag(etag)
+            resp.headers["Cache-Control"] = cache_control
+            return resp
+
+        # send_from_directory -> conditional/Range + wsgi.file_wrapper (bzw. X-Sendfile)
+        resp = send_from_directory(
+            DATA_BASE_RESOLVED,
+            rel_path,
+            mimetype=_guess_mime(fp.suffix.lower()),
+            conditional=True,
+            etag=etag,
+            last_modified=mtime,
+            max_age=MEDIA_MAX_AGE_S,
+        )
+        resp.headers["Cache-Control"] = cache_control
         return resp
     except Exception:
         return jsonify({"ok": False, "error": "invalid_path"}), 400
@@ -679,33 +903,58 @@ def media(rel_path: str):
 # 6) UI
 # ------------------------------------------------------------
 
-HTML = r"""<!doctype html>
-<html lang="de">
-<head>
-  <meta charset="utf-8"/>
-  <meta name="viewport" content="width=device-width, initial-scale=1"/>
-  <meta name="theme-color" content="#0b0f19"/>
-  <meta name="robots" content="noindex,nofollow"/>
-  <title>{{ page_title }}</title>
-
-  <style>
-  :root{
-    --bg: #0b0f19;
-    --bg2:#0f172a;
-    --card:#111a2e;
-    --text:#e6eaf2;
-    --muted:#a8b3cf;
-    --border: rgba(255,255,255,.10);
-    --shadow: 0 18px 60px rgba(0,0,0,.35);
-    --primary:#6ea8fe;
-    --primary2:#8bd4ff;
-    --focus: rgba(110,168,254,.45);
-    --radius: 18px;
-    --container: 1100px;
-    --gap: 18px;
-    --font: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, "Apple Color Emoji","Segoe UI Emoji";
-  }
-  [data-theme="light"]{
+CSS = r""":root{
+  --bg: #0b0f19;
+  --bg2:#0f172a;
+  --card:#111a2e;
+  --text:#e6eaf2;
+  --muted:#a8b3cf;
+  --border: rgba(255,255,255,.10);
+  --shadow: 0 18px 60px rgba(0,0,0,.35);
+  --primary:#6ea8fe;
+  --primary2:#8bd4ff;
+  --focus: rgba(110,168,254,.45);
+  --radius: 18px;
+  --container: 1100px;
+  --gap: 18px;
+  --font: ui-sans-serif, system-ui, -apple-system, Segoe UI, Roboto, Helvetica, Arial, "Apple Color Emoji","Segoe UI Emoji";
+
+  /* Flächen, die sich je Theme unterscheiden (statt [data-theme="light"] .x-Overrides) */
+  --card-bg: rgba(255,255,255,.04);
+  --pill-bg: rgba(255,255,255,.04);
+  --inset-bg: rgba(255,255,255,.03);
+  --header-bg: rgba(10, 14, 24, .55);
+  --overlay-bg: rgba(17, 26, 46, .92);
+  --toast-bg: rgba(17, 26, 46, .92);
+  --btn-primary-text: #0b0f19;
+  --btn-secondary-bg: rgba(255,255,255,.06);
+  --btn-secondary-border: rgba(255,255,255,.02);
+}
+[data-theme="light"]{
+  --bg:#f6f7fb;
+  --bg2:#ffffff;
+  --card:#ffffff;
+  --text:#111827;
+  --muted:#4b5563;
+  --border: rgba(17,24,39,.12);
+  --shadow: 0 18px 60px rgba(17,24,39,.10);
+  --primary:#2563eb;
+  --primary2:#0ea5e9;
+  --focus: rgba(37,99,235,.25);
+
+  --card-bg: rgba(255,255,255,.92);
+  --pill-bg: rgba(17,24,39,.03);
+  --inset-bg: rgba(17,24,39,.02);
+  --header-bg: rgba(246,247,251,.75);
+  --overlay-bg: rgba(255,255,255,.92);
+  --toast-bg: rgba(255,255,255,.96);
+  --btn-primary-text: #ffffff;
+  --btn-secondary-bg: rgba(17,24,39,.04);
+  --btn-secondary-border: rgba(17,24,39,.04);
+}
+/* OS-Präferenz hell: korrekt ab dem ersten Paint, ohne JS; explizites data-theme="dark" gewinnt */
+@media (prefers-color-scheme: light){
+  :root:not([data-theme="dark"]){
     --bg:#f6f7fb;
     --bg2:#ffffff;
     --card:#ffffff;
@@ -716,475 +965,446 @@ HTML = r"""<!doctype html>
     --primary:#2563eb;
     --primary2:#0ea5e9;
     --focus: rgba(37,99,235,.25);
+
+    --card-bg: rgba(255,255,255,.92);
+    --pill-bg: rgba(17,24,39,.03);
+    --inset-bg: rgba(17,24,39,.02);
+    --header-bg: rgba(246,247,251,.75);
+    --overlay-bg: rgba(255,255,255,.92);
+    --toast-bg: rgba(255,255,255,.96);
+    --btn-primary-text: #ffffff;
+    --btn-secondary-bg: rgba(17,24,39,.04);
+    --btn-secondary-border: rgba(17,24,39,.04);
   }
-  *{box-sizing:border-box}
-  body{
-    margin:0;
-    font-family:var(--font);
-    background: radial-gradient(1200px 800px at 20% -10%, rgba(110,168,254,.25), transparent 55%),
-                radial-gradient(1000px 700px at 110% 10%, rgba(139,212,255,.20), transparent 55%),
-                linear-gradient(180deg, var(--bg), var(--bg2));
-    color:var(--text);
-  }
-
-
-  /* Layout: Quiz im Desktop-Viewport ohne Scrollen (so gut wie möglich) */
-  body{ display:flex; flex-direction:column; min-height:100vh; }
-  .site-header{ flex:0 0 auto; }
-  main{ flex:1 1 auto; }
-
-  @media (min-width: 900px){
-    body.in-quiz{ height:100vh; overflow:hidden; }
-    body.in-quiz main{ overflow:hidden; padding: 12px 0 14px; }
-    body.in-quiz .hero{ height:100%; padding: 6px 0 10px; }
-    body.in-quiz .quiz-wrap{ height:100%; }
-    body.in-quiz .quiz-grid{ height:100%; }
-    body.in-quiz .quiz-card{ max-height:100%; overflow:auto; }
-
-    /* Footer im Quiz ausblenden, spart Platz */
-    body.in-quiz .site-footer{ display:none; }
-
-    /* Platz sparen */
-    .quiz-media{ aspect-ratio: 4 / 3; max-height: 38vh; margin-top: 10px; }
-    .options{ grid-template-columns: 1fr 1fr; gap: 10px; }
-    .option-btn{ min-height: 46px; padding: 10px 12px; }
-  }
-
-  /* 3-2-1 + Richtig/Falsch Overlay (Wizard-Quiz Stil) */
-  .answer-overlay{
-    position: fixed;
-    inset: 0;
-    z-index: 120;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-    background: transparent;
-    backdrop-filter: blur(8px);
-  }
-  .answer-overlay.verdict{
-    background: rgba(0,0,0,.72);
-    backdrop-filter: blur(8px);
-  }
-  .answer-overlay[hidden]{ display:none; }
-
-  .overlay-label{
-    min-width: min(520px, 86vw);
-    padding: 26px 30px;
-    border-radius: 22px;
-    border: 1px solid var(--border);
-    background: rgba(17, 26, 46, .92);
-    box-shadow: var(--shadow);
-    text-align: center;
-    font-weight: 950;
-    letter-spacing: .06em;
-    text-transform: uppercase;
-    font-size: clamp(34px, 6vw, 70px);
-  }
-  [data-theme="light"] .overlay-label{ background: rgba(255,255,255,.92); }
-
-  .overlay-label.count{
-    letter-spacing: 0;
-    text-transform: none;
-    font-size: clamp(78px, 16vw, 150px);
-  }
-  .overlay-label.ok{
-    border-color: rgba(34,197,94,.60);
-    box-shadow: 0 0 0 4px rgba(34,197,94,.18), var(--shadow);
-  }
-  .overlay-label.bad{
-    border-color: rgba(239,68,68,.60);
-    box-shadow: 0 0 0 4px rgba(239,68,68,.18), var(--shadow);
-  }
-  .overlay-label.pop{ animation: overlayPop .26s ease-out; }
-  @keyframes overlayPop{
-    0%{ transform: scale(.88); opacity: .0; }
-    100%{ transform: scale(1); opacity: 1; }
-  }
-
-
-  /* Attribution (optional, nur nach Klick sichtbar) */
-  .attr-row{
-    display:flex;
-    justify-content:flex-end;
-    margin-top: 10px;
-  }
-  .attr-btn{
-    padding: 6px 10px;
-    font-size: 12px;
-    font-weight: 850;
-    opacity: .9;
-  }
-  .attr-box{
-    margin-top: 8px;
-    padding-top: 10px;
-    border-top: 1px solid var(--border);
-    color: var(--muted);
-    font-size: 12px;
-    line-height: 1.55;
-    word-break: break-word;
-  }
-  .attr-box a{ color: var(--text); text-decoration:none; border-bottom:1px solid transparent; }
-  .attr-box a:hover{ border-bottom-color: var(--text); }
-
-  /* Falsche Antworten nach der Antwort ausblenden */
-  .option-btn.fade-out{ opacity: 0; transform: translateY(6px) scale(.98); }
-
-  .container{max-width:var(--container); margin:0 auto; padding:0 18px;}
-  .skip-link{
-    position:absolute; left:-999px; top:10px;
-    background:var(--card); color:var(--text);
-    padding:10px 12px; border-radius:10px;
-    border:1px solid var(--border);
-  }
-  .skip-link:focus{left:10px; outline:2px solid var(--focus)}
-
-  /* Header */
-  .site-header{
-    position:sticky; top:0; z-index:20;
-    backdrop-filter: blur(10px);
-    background: rgba(10, 14, 24, .55);
-    border-bottom:1px solid var(--border);
-  }
-  [data-theme="light"] .site-header{ background: rgba(246,247,251,.75); }
-
-  .header-inner{
-    display:flex; align-items:center; justify-content:space-between;
-    padding:14px 0; gap:14px;
-  }
-  .brand{display:flex; align-items:center; gap:10px; text-decoration:none; color:var(--text); font-weight:700}
-  .brand-mark{
-    width:14px; height:14px; border-radius:6px;
-    background: linear-gradient(135deg, var(--primary), var(--primary2));
-    box-shadow: 0 10px 25px rgba(110,168,254,.25);
-  }
-
-  /* Dropdown */
-  .nav-dropdown{ position: relative; display: inline-flex; align-items: center; }
-  .nav-dropbtn{
-    background: none; border: none; padding: 0; margin: 0; font-family: inherit;
-    color: var(--muted); text-decoration: none; font-weight: 600;
-    display: inline-flex; align-items: center; gap: 8px;
-    cursor: pointer; height: 100%;
-  }
-  .nav-dropbtn:hover{ color: var(--text); transform: none; }
-  .nav-caret{ font-size: .9em; opacity: 1; }
-  .nav-menu{
-    position: absolute;
-    top: calc(100% + 10px);
-    left: 0;
-    min-width: 240px;
-    padding: 10px;
-    z-index: 6000;
-    backdrop-filter: blur(10px);
-    background: var(--card);
-  }
-  .nav-menu a{
-    display: block;
-    padding: 10px 10px;
-    border-radius: 12px;
-    text-decoration: none;
-    color: var(--text);
-    font-weight: 650;
-  }
-  .nav-menu a:hover{ background: rgba(110,168,254,.12); }
-  .nav-menu a:focus{ outline: 2px solid var(--focus); outline-offset: 2px; }
-
-  .header-actions{display:flex; gap:10px; align-items:center}
-  .header-note{
-    display:flex; align-items:center; gap:8px;
-    padding:8px 10px;
-    border-radius:12px;
-    border:1px solid var(--border);
-    background: rgba(255,255,255,.04);
-    color: var(--muted);
-    font-weight: 750;
-    font-size: 12px;
-    line-height: 1;
-    white-space: nowrap;
-  }
-  [data-theme="light"] .header-note{ background: rgba(17,24,39,.03); }
-  .header-note__label{
-    letter-spacing: .06em; text-transform: uppercase;
-    font-weight: 900; color: var(--muted);
-  }
-  .header-note__mail{
-    color: var(--text);
-    text-decoration: none;
-    font-weight: 850;
-  }
-  .header-note__mail:hover{ text-decoration: underline; }
-  @media (max-width: 720px){ .header-note__label{ display:none; } }
-
-  .btn{
-    display:inline-flex; align-items:center; justify-content:center;
-    gap:8px; padding:10px 14px;
-    border-radius:12px; border:1px solid var(--border);
-    text-decoration:none; font-weight:800;
-    color:var(--text); background: transparent;
-    cursor:pointer; user-select:none;
-  }
-  .btn:focus{outline:2px solid var(--focus); outline-offset:2px}
-  .btn-primary{
-    border-color: transparent;
-    background: linear-gradient(135deg, var(--primary), var(--primary2));
-    color: #0b0f19;
-  }
-  [data-theme="light"] .btn-primary{ color:#ffffff; }
-  .btn-secondary{ background: rgba(255,255,255,.06); border-color: rgba(255,255,255,.02); }
-  [data-theme="light"] .btn-secondary{ background: rgba(17,24,39,.04); border-color: rgba(17,24,39,.04); }
-  .btn-ghost{ background: transparent; }
-  .btn:hover{transform: translateY(-1px)}
-  .btn:active{transform:none}
-  .btn[disabled]{opacity:.55; cursor:not-allowed; transform:none;}
-
-  .sr-only{
-    position:absolute; width:1px; height:1px; padding:0; margin:-1px;
-    overflow:hidden; clip:rect(0,0,0,0); border:0;
-  }
-
-  /* Layout */
-  .hero{ padding: 10px 0 16px; }
-  h1{margin:0 0 10px; font-size:38px; line-height:1.1}
-  @media (max-width: 520px){ h1{font-size:32px} }
-  .lead{margin:0; color:var(--muted); font-size:15px; line-height:1.6}
-
-  .card{
-    border:1px solid var(--border);
-    border-radius: var(--radius);
-    padding:16px;
-    box-shadow: var(--shadow);
-    transition: transform .12s ease, border-color .12s ease;
-    background: rgba(255,255,255,.04);
-  }
-  [data-theme="light"] .card{ background: rgba(255,255,255,.92); }
-
-  .grid{
-    display:grid;
-    grid-template-columns: repeat(3, 1fr);
-    gap: var(--gap);
-    margin-top: 18px;
-  }
-  @media (max-width: 980px){ .grid{grid-template-columns: repeat(2, 1fr)} }
-  @media (max-width: 640px){ .grid{grid-template-columns: 1fr} }
-
-  .card-title{font-weight:900; font-size:16px; margin:0 0 8px}
-  .card-desc{color:var(--muted); margin:0 0 12px; line-height:1.55}
-
-  .level-meta{
-    display:flex; justify-content:space-between; gap:10px; flex-wrap:wrap;
-    color: var(--muted); font-weight: 750; font-size: 12px;
-  }
-  .pill{
-    border:1px solid var(--border);
-    background: rgba(255,255,255,.04);
-    border-radius:999px;
-    padding:5px 9px;
-    font-weight:900;
-    color: var(--muted);
-    display:inline-flex;
-    align-items:center;
-    gap:6px;
-  }
-  [data-theme="light"] .pill{ background: rgba(17,24,39,.03); }
-
-  .quiz-wrap{ display:none; margin-top: 18px; }
-  .quiz-grid{ display:grid; grid-template-columns: 1fr; gap: var(--gap); }
-
-  .quiz-card{ position:relative; overflow:hidden; }
-
-  .row{ display:flex; align-items:center; justify-content:space-between; gap:12px; flex-wrap:wrap; }
-  .stats{ display:flex; gap:10px; flex-wrap:wrap; align-items:center; }
-
-  .progress{
-    height: 12px;
-    border-radius: 999px;
-    border:1px solid var(--border);
-    background: rgba(255,255,255,.03);
-    overflow:hidden;
-  }
-  [data-theme="light"] .progress{ background: rgba(17,24,39,.02); }
-  .progress > div{
-    height:100%;
-    width:0%;
-    background: linear-gradient(135deg, var(--primary), var(--primary2));
-  }
+}
+*{box-sizing:border-box}
+body{
+  margin:0;
+  font-family:var(--font);
+  background: radial-gradient(1200px 800px at 20% -10%, rgba(110,168,254,.25), transparent 55%),
+              radial-gradient(1000px 700px at 110% 10%, rgba(139,212,255,.20), transparent 55%),
+              linear-gradient(180deg, var(--bg), var(--bg2));
+  color:var(--text);
+}
+
+/* 3-2-1 + Richtig/Falsch Overlay (Wizard-Quiz Stil) */
+.answer-overlay{
+  position: fixed;
+  inset: 0;
+  z-index: 120;
+  display: flex;
+  align-items: center;
+  justify-content: center;
+  background: transparent;
+  backdrop-filter: blur(8px);
+}
+.answer-overlay.verdict{
+  background: rgba(0,0,0,.72);
+  backdrop-filter: blur(8px);
+}
+/* ausblenden ohne display:none -> Ein-/Ausblenden löst kein Layout aus */
+.answer-overlay[hidden]{ display:flex; visibility:hidden; opacity:0; pointer-events:none; }
+/* eigene Compositor-Ebene nur, solange das Overlay sichtbar ist */
+.answer-overlay:not([hidden]) .overlay-label{ will-change: transform, opacity; }
+
+.overlay-label{
+  min-width: min(520px, 86vw);
+  padding: 26px 30px;
+  border-radius: 22px;
+  border: 1px solid var(--border);
+  background: var(--overlay-bg);
+  box-shadow: var(--shadow);
+  text-align: center;
+  font-weight: 950;
+  letter-spacing: .06em;
+  text-transform: uppercase;
+  font-size: clamp(34px, 6vw, 70px);
+}
+
+.overlay-label.count{
+  letter-spacing: 0;
+  text-transform: none;
+  font-size: clamp(78px, 16vw, 150px);
+}
+.overlay-label.ok{
+  border-color: rgba(34,197,94,.60);
+  box-shadow: 0 0 0 4px rgba(34,197,94,.18), var(--shadow);
+}
+.overlay-label.bad{
+  border-color: rgba(239,68,68,.60);
+  box-shadow: 0 0 0 4px rgba(239,68,68,.18), var(--shadow);
+}
+
+
+/* Attribution (optional, nur nach Klick sichtbar) */
+.attr-row{
+  display:flex;
+  justify-content:flex-end;
+  margin-top: 10px;
+}
+.attr-btn{
+  padding: 6px 10px;
+  font-size: 12px;
+  font-weight: 850;
+  opacity: .9;
+}
+.attr-box{
+  margin-top: 8px;
+  padding-top: 10px;
+  border-top: 1px solid var(--border);
+  color: var(--muted);
+  font-size: 12px;
+  line-height: 1.55;
+  word-break: break-word;
+}
+.attr-box a{ color: var(--text); text-decoration:none; border-bottom:1px solid transparent; }
+.attr-box a:hover{ border-bottom-color: var(--text); }
+
+.container{max-width:var(--container); margin:0 auto; padding:0 18px;}
+.skip-link{
+  position:absolute; left:-999px; top:10px;
+  background:var(--card); color:var(--text);
+  padding:10px 12px; border-radius:10px;
+  border:1px solid var(--border);
+}
+.skip-link:focus{left:10px; outline:2px solid var(--focus)}
+
+/* Header */
+.site-header{
+  position:sticky; top:0; z-index:20;
+  backdrop-filter: blur(10px);
+  background: var(--header-bg);
+  border-bottom:1px solid var(--border);
+}
+
+.header-inner{
+  display:flex; align-items:center; justify-content:space-between;
+  padding:14px 0; gap:14px;
+}
+.brand{display:flex; align-items:center; gap:10px; text-decoration:none; color:var(--text); font-weight:700}
+.brand-mark{
+  width:14px; height:14px; border-radius:6px;
+  background: linear-gradient(135deg, var(--primary), var(--primary2));
+  box-shadow: 0 10px 25px rgba(110,168,254,.25);
+}
+
+/* Dropdown */
+.nav-dropdown{ position: relative; display: inline-flex; align-items: center; }
+.nav-dropbtn{
+  background: none; border: none; padding: 0; margin: 0; font-family: inherit;
+  color: var(--muted); text-decoration: none; font-weight: 600;
+  display: inline-flex; align-items: center; gap: 8px;
+  cursor: pointer; height: 100%;
+}
+.nav-dropbtn:hover{ color: var(--text); transform: none; }
+.nav-caret{ font-size: .9em; opacity: 1; }
+.nav-menu{
+  position: absolute;
+  top: calc(100% + 10px);
+  left: 0;
+  min-width: 240px;
+  padding: 10px;
+  z-index: 6000;
+  backdrop-filter: blur(10px);
+  background: var(--card);
+}
+.nav-menu a{
+  display: block;
+  padding: 10px 10px;
+  border-radius: 12px;
+  text-decoration: none;
+  color: var(--text);
+  font-weight: 650;
+}
+.nav-menu a:hover{ background: rgba(110,168,254,.12); }
+.nav-menu a:focus{ outline: 2px solid var(--focus); outline-offset: 2px; }
+
+.header-actions{display:flex; gap:10px; align-items:center}
+.header-note{
+  display:flex; align-items:center; gap:8px;
+  padding:8px 10px;
+  border-radius:12px;
+  border:1px solid var(--border);
+  background: var(--pill-bg);
+  color: var(--muted);
+  font-weight: 750;
+  font-size: 12px;
+  line-height: 1;
+  white-space: nowrap;
+}
+.header-note__label{
+  letter-spacing: .06em; text-transform: uppercase;
+  font-weight: 900; color: var(--muted);
+}
+.header-note__mail{
+  color: var(--text);
+  text-decoration: none;
+  font-weight: 850;
+}
+.header-note__mail:hover{ text-decoration: underline; }
+@media (max-width: 720px){ .header-note__label{ display:none; } }
+
+.btn{
+  display:inline-flex; align-items:center; justify-content:center;
+  gap:8px; padding:10px 14px;
+  border-radius:12px; border:1px solid var(--border);
+  text-decoration:none; font-weight:800;
+  color:var(--text); background: transparent;
+  cursor:pointer; user-select:none;
+}
+.btn:focus{outline:2px solid var(--focus); outline-offset:2px}
+.btn-primary{
+  border-color: transparent;
+  background: linear-gradient(135deg, var(--primary), var(--primary2));
+  color: var(--btn-primary-text);
+}
+.btn-secondary{ background: var(--btn-secondary-bg); border-color: var(--btn-secondary-border); }
+.btn-ghost{ background: transparent; }
+/* Layer nur während Hover anfordern, nicht global (sonst ein Layer pro Button) */
+.btn:hover{transform: translateY(-1px); will-change: transform;}
+.btn:active{transform:none}
+.btn[disabled]{opacity:.55; cursor:not-allowed; transform:none;}
+
+.sr-only{
+  position:absolute; width:1px; height:1px; padding:0; margin:-1px;
+  overflow:hidden; clip:rect(0,0,0,0); border:0;
+}
+
+/* Layout */
+.hero{ padding: 10px 0 16px; }
+h1{margin:0 0 10px; font-size:38px; line-height:1.1}
+@media (max-width: 520px){ h1{font-size:32px} }
+.lead{margin:0; color:var(--muted); font-size:15px; line-height:1.6}
+
+.card{
+  border:1px solid var(--border);
+  border-radius: var(--radius);
+  padding:16px;
+  box-shadow: var(--shadow);
+  transition: transform .12s ease, border-color .12s ease;
+  background: var(--card-bg);
+  /* Style-/Layout-Invalidierung auf die Karte begrenzen */
+  contain: layout paint;
+}
 
+.grid{
+  display:grid;
+  grid-template-columns: repeat(3, 1fr);
+  gap: var(--gap);
+  margin-top: 18px;
+}
+@media (max-width: 980px){ .grid{grid-template-columns: repeat(2, 1fr)} }
+@media (max-width: 640px){ .grid{grid-template-columns: 1fr} }
+/* Level-Karten außerhalb des Viewports nicht rendern; ~160px = Titel + Pills + Button */
+.grid > .card{
+  content-visibility: auto;
+  contain-intrinsic-size: auto 160px;
+}
+
+.card-title{font-weight:900; font-size:16px; margin:0 0 8px}
+.card-desc{color:var(--muted); margin:0 0 12px; line-height:1.55}
+
+.level-meta{
+  display:flex; justify-content:space-between; gap:10px; flex-wrap:wrap;
+  color: var(--muted); font-weight: 750; font-size: 12px;
+}
+.pill{
+  border:1px solid var(--border);
+  background: var(--pill-bg);
+  border-radius:999px;
+  padding:5px 9px;
+  font-weight:900;
+  color: var(--muted);
+  display:inline-flex;
+  align-items:center;
+  gap:6px;
+}
+
+.quiz-wrap{ display:none; margin-top: 18px; }
+.quiz-grid{ display:grid; grid-template-columns: 1fr; gap: var(--gap); }
+
+.quiz-card{ position:relative; overflow:hidden; }
+
+.row{ display:flex; align-items:center; justify-content:space-between; gap:12px; flex-wrap:wrap; }
+.stats{ display:flex; gap:10px; flex-wrap:wrap; align-items:center; }
+
+.progress{
+  height: 12px;
+  border-radius: 999px;
+  border:1px solid var(--border);
+  background: var(--inset-bg);
+  overflow:hidden;
+}
+.progress > div{
+  height:100%;
+  width:0%;
+  background: linear-gradient(135deg, var(--primary), var(--primary2));
+}
+
+.quiz-media{
+  width:100%;
+  border-radius: 16px;
+  border:1px solid var(--border);
+  overflow:hidden;
+  background: var(--inset-bg);
+  aspect-ratio: 1 / 1;
+  display:flex;
+  align-items:center;
+  justify-content:center;
+  margin-top: 14px;
+}
+.quiz-media img{
+  width:100%;
+  height:100%;
+  object-fit: contain;
+  display:block;
+}
+
+.question{
+  margin-top: 12px;
+  font-weight: 950;
+  font-size: 20px;
+  line-height: 1.45;
+}
+
+.options{
+  display:grid;
+  grid-template-columns: 1fr;
+  gap: 12px;
+  margin-top: 12px;
+}
+
+.option-btn{
+  width:100%;
+  justify-content:space-between;
+  text-align:left;
+  border-color: var(--border);
+  background: var(--inset-bg);
+  font-weight: 900;
+  font-size: clamp(13px, 1.2vw, 16px);
+  line-height: 1.25;
+  padding: 12px 14px;
+  min-height: 52px;
+  transition: opacity .22s ease, transform .22s ease;
+}
+.option-btn[disabled]{ cursor:not-allowed; transform:none; opacity:.80; }
+/* Falsche Antworten nach der Antwort ausblenden (nach [disabled], sonst gewinnt dessen opacity) */
+.option-btn.fade-out{ opacity: 0; transform: translateY(6px) scale(.98); will-change: opacity, transform; }
+/* Platz bleibt reserviert: kein Reflow, die richtige Antwort springt nicht */
+.option-btn.hidden{ opacity: 0; visibility: hidden; pointer-events: none; will-change: auto; }
+.option-btn.ok{
+  border-color: rgba(34,197,94,.55);
+  box-shadow: 0 0 0 3px rgba(34,197,94,.15);
+}
+.option-btn.bad{
+  border-color: rgba(239,68,68,.55);
+  box-shadow: 0 0 0 3px rgba(239,68,68,.15);
+}
+
+.actions{ display:flex; gap:10px; flex-wrap:wrap; margin-top: 14px; }
+
+.toast{
+  position: fixed;
+  right: 16px;
+  bottom: 16px;
+  max-width: min(420px, calc(100vw - 32px));
+  z-index: 80;
+  display:flex;
+  flex-direction:column;
+  gap:10px;
+  pointer-events:none;
+}
+.toast .t{
+  pointer-events:none;
+  border:1px solid var(--border);
+  border-radius: 14px;
+  background: var(--toast-bg);
+  backdrop-filter: blur(10px);
+  color: var(--text);
+  box-shadow: var(--shadow);
+  padding: 12px 14px;
+  font-weight: 850;
+}
+.toast .t small{
+  display:block;
+  margin-top:6px;
+  color: var(--muted);
+  font-weight: 750;
+}
+
+body.in-quiz .hero .lead{ display:none; }
+body.in-quiz .hero h1{ display:none; }
+
+.site-footer{
+  margin-top: 32px;
+  padding: 18px 0 26px;
+  border-top: 1px solid var(--border);
+  color: var(--muted);
+  font-size: 12px;
+  line-height: 1.6;
+}
+.site-footer a{ color: var(--text); text-decoration: none; }
+.site-footer a:hover{ text-decoration: underline; }
+
+.footer-title{
+  font-weight: 900;
+  letter-spacing: .06em;
+  text-transform: uppercase;
+  color: var(--muted);
+  margin: 0 0 6px;
+}
+.footer-text{ margin: 0 0 8px; }
+.footer-text:last-child{ margin-bottom: 0; }
+
+
+/* ---------------------------------------------------------
+   Desktop: alles im Viewport (keine Page-Scrollbars)
+   - Seite selbst bleibt fix im Viewport
+   - Quiz-Card scrollt intern, falls Steckbrief zu lang ist
+   --------------------------------------------------------- */
+body{ display:flex; flex-direction:column; min-height:100vh; }
+.site-header{ flex:0 0 auto; }
+main{ flex:1 1 auto; }
+
+@media (min-width: 900px){
+  body.in-quiz{ height:100vh; overflow:hidden; }
+  body.in-quiz main{ overflow:hidden; padding: 12px 0 14px; }
+  body.in-quiz .hero{ height:100%; padding: 6px 0 10px; }
+  body.in-quiz .quiz-wrap{ height:100%; }
+  body.in-quiz .quiz-grid{ height:100%; }
+  body.in-quiz .quiz-card{ max-height:100%; overflow:auto; }
+  body.in-quiz .site-footer{ display:none; }
+
+  /* Platz sparen */
+  h1{ font-size:32px; }
+  .question{ font-size:18px; margin-top:10px; }
   .quiz-media{
-    width:100%;
-    border-radius: 16px;
-    border:1px solid var(--border);
-    overflow:hidden;
-    background: rgba(255,255,255,.03);
-    aspect-ratio: 1 / 1;
-    display:flex;
-    align-items:center;
-    justify-content:center;
-    margin-top: 14px;
-  }
-  [data-theme="light"] .quiz-media{ background: rgba(17,24,39,.02); }
-  .quiz-media img{
-    width:100%;
-    height:100%;
-    object-fit: contain;
-    display:block;
-  }
-
-  .question{
-    margin-top: 12px;
-    font-weight: 950;
-    font-size: 20px;
-    line-height: 1.45;
-  }
-
-  .options{
-    display:grid;
-    grid-template-columns: 1fr;
-    gap: 12px;
-    margin-top: 12px;
-  }
-
-  .option-btn{
-    width:100%;
-    justify-content:space-between;
-    text-align:left;
-    border-color: rgba(255,255,255,.10);
-    background: rgba(255,255,255,.03);
-    font-weight: 900;
-    font-size: clamp(13px, 1.2vw, 16px);
-    line-height: 1.25;
-    padding: 12px 14px;
-    min-height: 52px;
-    transition: opacity .22s ease, transform .22s ease;
-  }
-  [data-theme="light"] .option-btn{
-    border-color: rgba(17,24,39,.12);
-    background: rgba(17,24,39,.02);
-  }
-  .option-btn[disabled]{ cursor:not-allowed; transform:none; opacity:.80; }
-  .option-btn.dim{ opacity:.45; }
-  .option-btn.ok{
-    border-color: rgba(34,197,94,.55);
-    box-shadow: 0 0 0 3px rgba(34,197,94,.15);
-  }
-  .option-btn.bad{
-    border-color: rgba(239,68,68,.55);
-    box-shadow: 0 0 0 3px rgba(239,68,68,.15);
-  }
-
-  .actions{ display:flex; gap:10px; flex-wrap:wrap; margin-top: 14px; }
-
-  .details{ margin-top: var(--gap); }
-  .kv{
-    display:grid;
-    grid-template-columns: 1fr 1.4fr;
-    gap: 10px 14px;
+    aspect-ratio: 4 / 3;
+    max-height: 38vh;
     margin-top: 10px;
   }
-  @media (max-width: 640px){
-    .kv{ grid-template-columns: 1fr; }
-  }
-  .k{ color: var(--muted); font-weight: 900; }
-  .v{ font-weight: 750; }
-  .source{
-    margin-top: 14px;
-    padding-top: 12px;
-    border-top: 1px solid var(--border);
-    color: var(--muted);
-    font-weight: 650;
-    line-height:1.5;
-    font-size: 13px;
-    word-break: break-word;
-  }
-  .source a{ color: var(--text); text-decoration:none; border-bottom:1px solid transparent; }
-  .source a:hover{ border-bottom-color: var(--text); }
-
-  .toast{
-    position: fixed;
-    right: 16px;
-    bottom: 16px;
-    max-width: min(420px, calc(100vw - 32px));
-    z-index: 80;
-    display:flex;
-    flex-direction:column;
-    gap:10px;
-    pointer-events:none;
-  }
-  .toast .t{
-    pointer-events:none;
-    border:1px solid var(--border);
-    border-radius: 14px;
-    background: rgba(17, 26, 46, .92);
-    backdrop-filter: blur(10px);
-    color: var(--text);
-    box-shadow: var(--shadow);
-    padding: 12px 14px;
-    font-weight: 850;
-  }
-  [data-theme="light"] .toast .t{ background: rgba(255,255,255,.96); }
-  .toast .t small{
-    display:block;
-    margin-top:6px;
-    color: var(--muted);
-    font-weight: 750;
-  }
-
-  body.in-quiz .hero .lead{ display:none; }
-  body.in-quiz .hero h1{ display:none; }
-
-  .site-footer{
-    margin-top: 32px;
-    padding: 18px 0 26px;
-    border-top: 1px solid var(--border);
-    color: var(--muted);
-    font-size: 12px;
-    line-height: 1.6;
-  }
-  .site-footer a{ color: var(--text); text-decoration: none; }
-  .site-footer a:hover{ text-decoration: underline; }
-
-  .footer-title{
-    font-weight: 900;
-    letter-spacing: .06em;
-    text-transform: uppercase;
-    color: var(--muted);
-    margin: 0 0 6px;
-  }
-  .footer-text{ margin: 0 0 8px; }
-  .footer-text:last-child{ margin-bottom: 0; }
-  
-
-  /* ---------------------------------------------------------
-     Desktop: alles im Viewport (keine Page-Scrollbars)
-     - Seite selbst bleibt fix im Viewport
-     - Quiz-Card scrollt intern, falls Steckbrief zu lang ist
-     --------------------------------------------------------- */
-  body{ display:flex; flex-direction:column; min-height:100vh; }
-  .site-header{ flex:0 0 auto; }
-  main{ flex:1 1 auto; }
-
-  @media (min-width: 900px){
-    body.in-quiz{ height:100vh; overflow:hidden; }
-    body.in-quiz main{ overflow:hidden; padding: 12px 0 14px; }
-    body.in-quiz .hero{ height:100%; padding: 6px 0 10px; }
-    body.in-quiz .quiz-wrap{ height:100%; }
-    body.in-quiz .quiz-grid{ height:100%; }
-    body.in-quiz .quiz-card{ max-height:100%; overflow:auto; }
-    body.in-quiz .site-footer{ display:none; }
-
-    /* Platz sparen */
-    h1{ font-size:32px; }
-    .question{ font-size:18px; margin-top:10px; }
-    .quiz-media{
-      aspect-ratio: 4 / 3;
-      max-height: 38vh;
-      margin-top: 10px;
-    }
-    .options{ grid-template-columns: 1fr 1fr; gap: 10px; }
-    .option-btn{ min-height: 46px; padding: 10px 12px; }
-    .actions{ margin-top: 10px; }
-    .details{ margin-top: 12px; }
-  }
-</style>
+  .options{ grid-template-columns: 1fr 1fr; gap: 10px; }
+  .option-btn{ min-height: 46px; padding: 10px 12px; }
+  .actions{ margin-top: 10px; }
+}
+"""
+
+HTML = r"""<!doctype html>
+<html lang="de">
+<head>
+  <meta charset="utf-8"/>
+  <meta name="viewport" content="width=device-width, initial-scale=1"/>
+  <meta name="theme-color" content="#0b0f19"/>
+  <meta name="robots" content="noindex,nofollow"/>
+  <title>{{ page_title }}</title>
+
+  <!-- Theme vor dem ersten Paint setzen (einziges blockierendes Script) -->
+  <!-- pawQuizTheme.v1 = explizite Wahl; alter Key "theme" wurde früher immer mit "dark" befüllt -> nur "light" zählt -->
+  <script>try{var t=localStorage.getItem("pawQuizTheme.v1")||(localStorage.getItem("theme")==="light"?"light":"");if(t==="light"||t==="dark")document.documentElement.setAttribute("data-theme",t);}catch(e){}</script>
+  <link rel="stylesheet" href="{{ css_href }}"/>
+  <!-- API liegt auf demselben Origin (Verbindung steht schon); stattdessen den ersten API-Call früh starten -->
+  <link rel="preload" href="/api/levels" as="fetch" crossorigin="anonymous"/>
+  <script defer src="{{ js_href }}"></script>
 </head>
 
 <body>
@@ -1224,8 +1444,8 @@ HTML = r"""<!doctype html>
           <a class="header-note__mail" href="mailto:info@data-tales.dev">info@data-tales.dev</a>
         </div>
 
-        <button class="btn btn-ghost" id="themeToggle" type="button" aria-label="Theme umschalten">
-          <span aria-hidden="true" id="themeIcon">☾</span>
+        <button class="btn btn-ghost" id="themeToggle" data-ref="themeToggle" type="button" aria-label="Theme umschalten">
+          <span aria-hidden="true" id="themeIcon" data-ref="themeIcon">☾</span>
           <span class="sr-only">Theme umschalten</span>
         </button>
       </div>
@@ -1238,60 +1458,66 @@ HTML = r"""<!doctype html>
         <h1>{{ page_h1 }}</h1>
         <p class="lead">{{ page_subtitle }}</p>
 
-        <div id="errorBanner" class="card" style="display:none; margin-top:18px;">
+        <div id="errorBanner" data-ref="errorBanner" class="card" style="display:none; margin-top:18px;">
           <div class="card-title">Quiz nicht verfügbar</div>
-          <div class="card-desc" id="errorText"></div>
+          <div class="card-desc" id="errorText" data-ref="errorText"></div>
         </div>
 
-        <div id="levelWrap">
-          <div class="grid" id="levelGrid"></div>
+        <div id="levelWrap" data-ref="levelWrap">
+          <div class="grid" id="levelGrid" data-ref="levelGrid"></div>
         </div>
 
-        <div class="quiz-wrap" id="quizWrap">
+        <div class="quiz-wrap" id="quizWrap" data-ref="quizWrap">
           <div class="quiz-grid">
 
-            <div class="card quiz-card" id="quizCard" style="display:block;">
+            <div class="card quiz-card" id="quizCard" data-ref="quizCard" style="display:block;">
               <div class="row">
                 <div class="stats">
-                  <span class="pill">Level <strong id="uiLevel">1</strong></span>
-                  <span class="pill">Score <strong id="uiScore">0</strong></span>
-                  <span class="pill">Frage <strong id="uiPos">1</strong>/15</span>
+                  <span class="pill">Level <strong id="uiLevel" data-ref="uiLevel">1</strong></span>
+                  <span class="pill">Score <strong id="uiScore" data-ref="uiScore">0</strong></span>
+                  <span class="pill">Frage <strong id="uiPos" data-ref="uiPos">1</strong>/15</span>
                 </div>
               </div>
 
               <div style="margin-top:12px;">
                 <div class="progress" aria-label="Progress">
-                  <div id="uiBar"></div>
+                  <div id="uiBar" data-ref="uiBar"></div>
                 </div>
               </div>
 
               <div class="quiz-media" aria-label="Quiz-Bild">
-                <img id="quizImg" src="" alt="" loading="eager" decoding="async" />
+                <img id="quizImg" data-ref="quizImg" alt="" width="512" height="512" loading="lazy" decoding="async" fetchpriority="high" />
               </div>
 
-              <div class="question" id="uiQuestion">Wer ist das?</div>
-              <div class="options" id="uiOptions"></div>
+              <div class="question" id="uiQuestion" data-ref="uiQuestion">Wer ist das?</div>
+              <div class="options" id="uiOptions" data-ref="uiOptions"></div>
 
               <div class="actions">
-                <button class="btn btn-secondary" id="btnBackToLevels" type="button">Level wählen</button>
-                <button class="btn btn-ghost" id="btnPrev" type="button">Zurück</button>
-                <button class="btn btn-primary" id="btnNext" type="button">Weiter</button>
-                <button class="btn btn-ghost" id="btnAuto" type="button" title="Automatisch weiter nach Antwort">Auto: An</button>
+                <button class="btn btn-secondary" id="btnBackToLevels" data-ref="btnBackToLevels" type="button">Level wählen</button>
+                <button class="btn btn-ghost" id="btnPrev" data-ref="btnPrev" type="button">Zurück</button>
+                <button class="btn btn-primary" id="btnNext" data-ref="btnNext" type="button">Weiter</button>
+                <button class="btn btn-ghost" id="btnAuto" data-ref="btnAuto" type="button" title="Automatisch weiter nach Antwort">Auto: An</button>
               </div>
 
               <div class="attr-row">
-                <button class="btn btn-ghost attr-btn" id="btnAttr" type="button" >ⓘ Quelle</button>
+                <button class="btn btn-ghost attr-btn" id="btnAttr" data-ref="btnAttr" type="button" >ⓘ Quelle</button>
               </div>
-              <div class="attr-box" id="attrBox" ></div>
+              <div class="attr-box" id="attrBox" data-ref="attrBox" ></div>
 
             </div>
 
-            <div class="card" id="resultCard" style="display:none;">
+            <div class="card" id="resultCard" data-ref="resultCard" style="display:none;">
               <div class="card-title">Run abgeschlossen</div>
-              <p class="card-desc" id="resultText"></p>
+              <p class="card-desc" id="resultText">
+                <strong>Level <span data-ref="rtLevel"></span></strong><br/>
+                Score: <strong data-ref="rtScore"></strong> / 15<br/>
+                Richtig: <strong data-ref="rtCorrect"></strong><br/>
+                Trefferquote: <strong data-ref="rtAcc"></strong><br/>
+                Zeit: <strong data-ref="rtTime"></strong>
+              </p>
               <div class="actions">
-                <button class="btn btn-secondary" id="btnAgain" type="button">Nochmal (gleiches Level)</button>
-                <button class="btn btn-ghost" id="btnResultBack" type="button">Zur Level-Auswahl</button>
+                <button class="btn btn-secondary" id="btnAgain" data-ref="btnAgain" type="button">Nochmal (gleiches Level)</button>
+                <button class="btn btn-ghost" id="btnResultBack" data-ref="btnResultBack" type="button">Zur Level-Auswahl</button>
               </div>
             </div>
 
@@ -1318,14 +1544,17 @@ HTML = r"""<!doctype html>
   </footer>
 
 
-  <div class="answer-overlay" id="answerOverlay" aria-hidden="true" hidden>
-    <div class="overlay-label count pop" id="answerOverlayLabel">3</div>
+  <div class="answer-overlay" id="answerOverlay" data-ref="answerOverlay" aria-hidden="true" hidden>
+    <div class="overlay-label count" id="answerOverlayLabel" data-ref="answerOverlayLabel">3</div>
   </div>
 
-  <div class="toast" id="toast"></div>
+  <div class="toast" id="toast" data-ref="toast"></div>
+
+</body>
+</html>
+"""
 
-<script>
-(function(){
+JS = r"""(function(){
   // Dropdown (Header)
   const dd = document.querySelector('[data-dropdown]');
   if(dd){
@@ -1348,89 +1577,115 @@ HTML = r"""<!doctype html>
     setOpen(false);
   }
 
+  // Element-Referenzen: ein einziger Durchlauf über alle [data-ref]
+  const refs = {};
+  for(const el of document.querySelectorAll("[data-ref]")) refs[el.dataset.ref] = el;
+
   // Theme Toggle
-  const themeKey = "theme";
+  const themeKey = "pawQuizTheme.v1"; // nur explizite Umschaltungen; siehe Inline-Script im <head>
   const root = document.documentElement;
-  const themeToggle = document.getElementById("themeToggle");
-  const themeIcon = document.getElementById("themeIcon");
+  const {themeToggle, themeIcon} = refs;
+
+  const prefersLight = window.matchMedia ? window.matchMedia("(prefers-color-scheme: light)") : null;
 
+  // gespeicherte Wahl > OS-Präferenz (CSS greift über prefers-color-scheme bereits ohne JS)
+  function currentTheme(){
+    const t = root.getAttribute("data-theme");
+    if(t === "light" || t === "dark") return t;
+    return (prefersLight && prefersLight.matches) ? "light" : "dark";
+  }
+  function syncThemeIcon(){
+    themeIcon.textContent = currentTheme() === "light" ? "☀" : "☾";
+  }
   function setTheme(mode){
-    if(mode === "light"){
-      root.setAttribute("data-theme","light");
-      themeIcon.textContent = "☀";
-    }else{
-      root.removeAttribute("data-theme");
-      themeIcon.textContent = "☾";
-    }
+    // explizite Wahl immer als Attribut setzen, damit sie die OS-Präferenz überstimmt
+    root.setAttribute("data-theme", mode === "light" ? "light" : "dark");
+    syncThemeIcon();
     localStorage.setItem(themeKey, mode);
   }
-  setTheme(localStorage.getItem(themeKey) || "dark");
+  // data-theme setzt bereits das Inline-Script im <head>; hier nur das Icon nachziehen
+  syncThemeIcon();
+  if(prefersLight && prefersLight.addEventListener) prefersLight.addEventListener("change", syncThemeIcon);
   themeToggle.addEventListener("click", () => {
-    const cur = localStorage.getItem(themeKey) || "dark";
-    setTheme(cur === "light" ? "dark" : "light");
+    setTheme(currentTheme() === "light" ? "dark" : "light");
   });
 
   // UI refs
-  const errorBanner = document.getElementById("errorBanner");
-  const errorText = document.getElementById("errorText");
-  const levelWrap = document.getElementById("levelWrap");
-  const levelGrid = document.getElementById("levelGrid");
-  const quizWrap = document.getElementById("quizWrap");
-  const quizCard = document.getElementById("quizCard");
-  const resultCard = document.getElementById("resultCard");
-
-  const uiLevel = document.getElementById("uiLevel");
-  const uiScore = document.getElementById("uiScore");
-  const uiPos = document.getElementById("uiPos");
-  const uiBar = document.getElementById("uiBar");
-  const quizImg = document.getElementById("quizImg");
-  const uiQuestion = document.getElementById("uiQuestion");
-  const uiOptions = document.getElementById("uiOptions");
-
-  const btnAttr = document.getElementById("btnAttr");
-  const attrBox = document.getElementById("attrBox");
-
-  const answerOverlay = document.getElementById("answerOverlay");
-  const answerOverlayLabel = document.getElementById("answerOverlayLabel");
-
-
-  const btnPrev = document.getElementById("btnPrev");
-  const btnNext = document.getElementById("btnNext");
-  const btnBackToLevels = document.getElementById("btnBackToLevels");
-
-  const btnAuto = document.getElementById("btnAuto");
-
-  const btnAgain = document.getElementById("btnAgain");
-  const btnResultBack = document.getElementById("btnResultBack");
-  const resultText = document.getElementById("resultText");
-
-  const toast = document.getElementById("toast");
+  const {
+    errorBanner, errorText, levelWrap, levelGrid, quizWrap, quizCard, resultCard,
+    uiLevel, uiScore, uiPos, uiBar, quizImg, uiQuestion, uiOptions,
+    btnAttr, attrBox, answerOverlay, answerOverlayLabel,
+    btnPrev, btnNext, btnBackToLevels, btnAuto,
+    btnAgain, btnResultBack, toast,
+    rtLevel, rtScore, rtCorrect, rtAcc, rtTime,
+  } = refs;
 
   // LocalStorage keys
   const RUNS_KEY = "pawQuizRuns.v1"; // map { "<level>": { run: "<token>", ts: <ms> } }
   const STATS_KEY = "pawQuizStats.v1"; // map { "<level>": { bestScore: n } }
+  const LEVELS_KEY = "pawQuizLevels.v1"; // { levels: [...], eligible_total: n, ts: <ms> }
+  const LEVELS_CACHE_MAX_AGE_MS = 60 * 60 * 1000;
 
   const SETTINGS_KEY = "pawQuizSettings.v1"; // { autoAdvance: bool, autoAdvanceMs: number, unlockMinScore: number }
   const DEFAULT_UNLOCK_MIN_SCORE = 9;   // >= 9/15 schaltet das nächste Level frei
   const DEFAULT_AUTO_ADVANCE = true;    // automatisch zur nächsten Frage nach Antwort
   const DEFAULT_AUTO_ADVANCE_MS = 900;  // Delay, damit Feedback sichtbar bleibt
 
-  function loadSettings(){
+  // localStorage wird nur einmal geparst (und bei "storage"-Events anderer Tabs neu);
+  // danach arbeiten alle Zugriffe auf dem In-Memory-Objekt und schreiben bei Änderungen durch
+  function readStore(key){
     try{
-      const obj = JSON.parse(localStorage.getItem(SETTINGS_KEY) || "{}");
+      const obj = JSON.parse(localStorage.getItem(key) || "{}");
       return (obj && typeof obj === "object") ? obj : {};
     }catch(_e){
       return {};
     }
   }
+
+  // requestIdleCallback mit setTimeout-Fallback (Safari)
+  function onIdle(cb, timeout){
+    if(typeof window.requestIdleCallback === "function"){
+      window.requestIdleCallback(cb, {timeout});
+    }else{
+      setTimeout(cb, 1);
+    }
+  }
+
+  // Schreibzugriffe sammeln und in Leerlaufzeit ausführen (blockiert sonst den Main-Thread)
+  const _pendingWrites = new Map();
+  let _writeScheduled = false;
+  function flushWrites(){
+    _writeScheduled = false;
+    for(const [k, v] of _pendingWrites){
+      try{ localStorage.setItem(k, JSON.stringify(v)); }catch(_e){}
+    }
+    _pendingWrites.clear();
+  }
+  function scheduleWrite(key, obj){
+    _pendingWrites.set(key, obj);
+    if(_writeScheduled) return;
+    _writeScheduled = true;
+    onIdle(flushWrites, 1000);
+  }
+  window.addEventListener("beforeunload", flushWrites);
+  window.addEventListener("pagehide", flushWrites);
+
+  let _settings = readStore(SETTINGS_KEY);
+  function loadSettings(){
+    return _settings;
+  }
   function saveSettings(obj){
-    localStorage.setItem(SETTINGS_KEY, JSON.stringify(obj || {}));
+    _settings = obj || {};
+    scheduleWrite(SETTINGS_KEY, _settings);
   }
 
-  const settings = loadSettings();
-  let autoAdvance = (typeof settings.autoAdvance === "boolean") ? settings.autoAdvance : DEFAULT_AUTO_ADVANCE;
-  let autoAdvanceMs = (typeof settings.autoAdvanceMs === "number" && settings.autoAdvanceMs >= 0) ? settings.autoAdvanceMs : DEFAULT_AUTO_ADVANCE_MS;
-  let unlockMinScore = (typeof settings.unlockMinScore === "number" && settings.unlockMinScore >= 0) ? settings.unlockMinScore : DEFAULT_UNLOCK_MIN_SCORE;
+  let autoAdvance, autoAdvanceMs, unlockMinScore;
+  function applySettings(settings){
+    autoAdvance = (typeof settings.autoAdvance === "boolean") ? settings.autoAdvance : DEFAULT_AUTO_ADVANCE;
+    autoAdvanceMs = (typeof settings.autoAdvanceMs === "number" && settings.autoAdvanceMs >= 0) ? settings.autoAdvanceMs : DEFAULT_AUTO_ADVANCE_MS;
+    unlockMinScore = (typeof settings.unlockMinScore === "number" && settings.unlockMinScore >= 0) ? settings.unlockMinScore : DEFAULT_UNLOCK_MIN_SCORE;
+  }
+  applySettings(loadSettings());
 
   let advanceNonce = 0;
   function cancelAutoAdvance(){
@@ -1444,6 +1699,7 @@ HTML = r"""<!doctype html>
 
   function setAutoAdvance(enabled){
     autoAdvance = !!enabled;
+    const settings = loadSettings();
     settings.autoAdvance = autoAdvance;
     saveSettings(settings);
     updateAutoButton();
@@ -1463,13 +1719,30 @@ HTML = r"""<!doctype html>
     setTimeout(() => el.remove(), 2600);
   }
 
+  const _ENT = {'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'};
+  const _ENT_RE = /[&<>"']/g;
+  const _entity = c => _ENT[c];
+  let _escLastIn = null, _escLastOut = "";
   function escapeHtml(s){
-    return String(s).replace(/[&<>"']/g, c => ({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#39;'}[c]));
+    if(s == null) return "";
+    const str = "" + s;
+    // Ein-Eintrag-Cache: derselbe Toast-Text wird oft mehrfach hintereinander escaped
+    if(str === _escLastIn) return _escLastOut;
+    _escLastIn = str;
+    _escLastOut = str.replace(_ENT_RE, _entity);
+    return _escLastOut;
   }
 
   function wait(ms){ return new Promise(r => setTimeout(r, ms)); }
   function nextFrame(){ return new Promise(r => requestAnimationFrame(() => r())); }
 
+  const OVERLAY_POP_FRAMES = [
+    {transform: "scale(.88)", opacity: 0},
+    {transform: "scale(1)", opacity: 1},
+  ];
+  const OVERLAY_POP_TIMING = {duration: 260, easing: "ease-out"};
+  let overlayAnim = null;
+
   function overlaySet(text, kind){
     if(!answerOverlay || !answerOverlayLabel) return;
     // Backdrop nur bei Richtig/Falsch (nicht bei 3-2-1)
@@ -1480,10 +1753,14 @@ HTML = r"""<!doctype html>
     }
     answerOverlayLabel.textContent = String(text);
     answerOverlayLabel.className = `overlay-label ${kind || ""}`;
-    // restart animation
-    void answerOverlayLabel.offsetWidth;
-    answerOverlayLabel.classList.add("pop");
+    // Pop per Web Animations API: Neustart ohne erzwungenen Reflow
+    if(typeof answerOverlayLabel.animate !== "function") return;
+    if(overlayAnim) overlayAnim.cancel();
+    overlayAnim = answerOverlayLabel.animate(OVERLAY_POP_FRAMES, OVERLAY_POP_TIMING);
   }
+  const COUNTDOWN_STEP_MS = 600;
+  const COUNTDOWN_STEPS = [[0, "3"], [COUNTDOWN_STEP_MS, "2"], [2 * COUNTDOWN_STEP_MS, "1"], [3 * COUNTDOWN_STEP_MS, "…"]];
+
   async function playCountdownAndVerdictFromPromise(resultPromise, onAfterCountdown){
     if(!answerOverlay || !answerOverlayLabel){
       const res = await resultPromise;
@@ -1494,12 +1771,21 @@ HTML = r"""<!doctype html>
     answerOverlay.hidden = false;
     answerOverlay.setAttribute("aria-hidden", "false");
 
-    const stepMs = 600;
-    overlaySet("3", "count"); await wait(stepMs);
-    overlaySet("2", "count"); await wait(stepMs);
-    overlaySet("1", "count"); await wait(stepMs);
+    // 3-2-1-… als eine rAF-Schleife gegen performance.now() (kein Drift, keine Timer-Kette)
+    await new Promise(resolve => {
+      const start = performance.now();
+      let i = 0;
+      function tick(t){
+        while(i < COUNTDOWN_STEPS.length && t - start >= COUNTDOWN_STEPS[i][0]){
+          overlaySet(COUNTDOWN_STEPS[i][1], "count");
+          i++;
+        }
+        if(i < COUNTDOWN_STEPS.length) requestAnimationFrame(tick);
+        else resolve();
+      }
+      tick(start);
+    });
 
-    overlaySet("…", "count");
     const res = await resultPromise;
 
     await nextFrame();
@@ -1514,10 +1800,11 @@ HTML = r"""<!doctype html>
     return res;
   }
 
-  async function api(method, url, body){
-    const init = { method, headers: {"Content-Type":"application/json"} };
-    if(body) init.body = JSON.stringify(body);
-    const r = await fetch(url, init);
+  // einmal angelegt und für alle POSTs wiederverwendet
+  const JSON_HEADERS = new Headers({"Content-Type":"application/json"});
+  const bodyEncoder = new TextEncoder();
+
+  async function apiResult(r){
     const j = await r.json().catch(() => ({ok:false, error:"Antwort ist kein JSON."}));
     if(!r.ok || !j.ok){
       const err = j && j.error ? j.error : `HTTP ${r.status}`;
@@ -1526,16 +1813,38 @@ HTML = r"""<!doctype html>
     return j;
   }
 
-  function loadRuns(){
+  // GETs sind idempotent: ein neuer Aufruf bricht den vorherigen ab
+  let getInflight = null;
+  async function apiGet(url){
+    if(getInflight) getInflight.abort();
+    const ctrl = new AbortController();
+    getInflight = ctrl;
     try{
-      const obj = JSON.parse(localStorage.getItem(RUNS_KEY) || "{}");
-      return (obj && typeof obj === "object") ? obj : {};
-    }catch(_e){
-      return {};
+      return await apiResult(await fetch(url, {method: "GET", signal: ctrl.signal}));
+    }finally{
+      if(getInflight === ctrl) getInflight = null;
     }
   }
+
+  // POSTs verändern den Run-Zustand und werden nie abgebrochen;
+  // keepalive nur für die Antwort, damit sie auch bei einer Navigation noch ankommt
+  // (spekulative Prefetches sollen das begrenzte keepalive-Budget nicht belegen)
+  async function apiPost(url, body, keepalive = false){
+    const init = {method: "POST", headers: JSON_HEADERS};
+    if(keepalive) init.keepalive = true;
+    if(body) init.body = bodyEncoder.encode(JSON.stringify(body));
+    return apiResult(await fetch(url, init));
+  }
+
+  let _runs = readStore(RUNS_KEY);
+  let _stats = readStore(STATS_KEY);
+
+  function loadRuns(){
+    return _runs;
+  }
   function saveRuns(obj){
-    localStorage.setItem(RUNS_KEY, JSON.stringify(obj || {}));
+    _runs = obj || {};
+    scheduleWrite(RUNS_KEY, _runs);
   }
   function getRun(level){
     const m = loadRuns();
@@ -1544,7 +1853,10 @@ HTML = r"""<!doctype html>
   }
   function setRun(level, runToken){
     const m = loadRuns();
-    m[String(level)] = {run: runToken, ts: Date.now()};
+    const key = String(level);
+    // unveränderter Token (z.B. erneutes Anzeigen derselben Frage) -> kein Schreibauftrag
+    if(m[key] && m[key].run === runToken) return;
+    m[key] = {run: runToken, ts: Date.now()};
     saveRuns(m);
   }
   function clearRun(level){
@@ -1554,15 +1866,11 @@ HTML = r"""<!doctype html>
   }
 
   function loadStats(){
-    try{
-      const obj = JSON.parse(localStorage.getItem(STATS_KEY) || "{}");
-      return (obj && typeof obj === "object") ? obj : {};
-    }catch(_e){
-      return {};
-    }
+    return _stats;
   }
   function saveStats(obj){
-    localStorage.setItem(STATS_KEY, JSON.stringify(obj || {}));
+    _stats = obj || {};
+    scheduleWrite(STATS_KEY, _stats);
   }
   function getBestScore(level){
     const s = loadStats();
@@ -1581,8 +1889,34 @@ HTML = r"""<!doctype html>
   function isLevelUnlocked(level){
     if(unlockMinScore <= 0) return true;
     if(level <= 1) return true;
-    return getBestScore(level - 1) >= unlockMinScore;
-  }
+    const e = _stats[String(level - 1)];
+    return (e && typeof e.bestScore === "number" ? e.bestScore : 0) >= unlockMinScore;
+  }
+
+  // ein anderer Tab hat geschrieben: Cache neu einlesen, sonst schreibt dieser Tab
+  // später seinen veralteten Stand über die neueren Runs/Best-Scores zurück.
+  // Eigene, noch nicht geschriebene Änderungen werden darübergelegt.
+  function reloadStore(key){
+    const fresh = readStore(key);
+    const pending = _pendingWrites.get(key);
+    if(!pending) return fresh;
+    const merged = Object.assign(fresh, pending);
+    _pendingWrites.set(key, merged);
+    return merged;
+  }
+  window.addEventListener("storage", (e) => {
+    if(e.storageArea !== localStorage) return;
+    const all = e.key === null; // localStorage.clear()
+    if(all || e.key === SETTINGS_KEY){
+      _settings = reloadStore(SETTINGS_KEY);
+      applySettings(_settings);
+      updateAutoButton();
+    }
+    if(all || e.key === RUNS_KEY) _runs = reloadStore(RUNS_KEY);
+    if(all || e.key === STATS_KEY) _stats = reloadStore(STATS_KEY);
+    // Best-Score, Run-Pill und Freischaltung hängen an allen drei Keys
+    if(levels.length && (all || e.key === RUNS_KEY || e.key === STATS_KEY || e.key === SETTINGS_KEY)) renderLevels();
+  });
 
   // Client state
   let levels = [];
@@ -1601,6 +1935,9 @@ HTML = r"""<!doctype html>
     errorText.textContent = "";
   }
   function showLevels(){
+    // verstecktes Quizbild nicht laden
+    clearQuizImage();
+    quizImg.loading = "lazy";
     document.body.classList.remove("in-quiz");
     levelWrap.style.display = "block";
     quizWrap.style.display = "none";
@@ -1608,6 +1945,7 @@ HTML = r"""<!doctype html>
     quizCard.style.display = "block";
   }
   function showQuiz(){
+    quizImg.loading = "eager";
     document.body.classList.add("in-quiz");
     levelWrap.style.display = "none";
     quizWrap.style.display = "block";
@@ -1622,79 +1960,56 @@ HTML = r"""<!doctype html>
     resultCard.style.display = "block";
   }
 
-  function renderLevels(eligibleTotal){
-    levelGrid.innerHTML = "";
-    for(const lv of levels){
-      const level = Number(lv.level);
-      const activeRun = getRun(level);
-      const best = getBestScore(level);
-
-
-      const unlocked = isLevelUnlocked(level);
-      const card = document.createElement("div");
-      card.className = "card";
-
-      const title = document.createElement("div");
-      title.className = "card-title";
-      title.textContent = `Level ${level}`;
-
-      const desc = document.createElement("p");
-      desc.className = "card-desc";
-
-      const meta = document.createElement("div");
-      meta.className = "level-meta";
-      meta.innerHTML = `
+  // Karten-Templates einmalig definiert; renderLevels setzt nur noch Strings zusammen
+  const LEVEL_CARD_TPL = (level, best, activeRun, unlocked) => {
+    let primary;
+    if(activeRun){
+      primary = `<button class="btn btn-primary" type="button" data-action="resume" data-level="${level}">Fortsetzen</button>`;
+    }else if(!unlocked){
+      primary = `<button class="btn btn-primary" type="button" disabled>Gesperrt (ab ${unlockMinScore}/15)</button>`;
+    }else{
+      primary = `<button class="btn btn-primary" type="button" data-action="start" data-level="${level}">Starten</button>`;
+    }
+    return `<div class="card" data-level="${level}">
+      <div class="card-title">Level ${level}</div>
+      <p class="card-desc"></p>
+      <div class="level-meta">
         <span class="pill">Best <strong>${best}</strong>/15</span>
         ${activeRun ? `<span class="pill">Run gespeichert</span>` : ``}
         ${(!unlocked && !activeRun) ? `<span class="pill">Gesperrt (ab ${unlockMinScore}/15)</span>` : ``}
-      `;
-
-      const actions = document.createElement("div");
-      actions.style.display = "flex";
-      actions.style.gap = "10px";
-      actions.style.flexWrap = "wrap";
-      actions.style.marginTop = "10px";
-
-      const primary = document.createElement("button");
-      primary.className = "btn btn-primary";
-      primary.type = "button";
-
-      if(activeRun){
-        primary.textContent = "Fortsetzen";
-        primary.addEventListener("click", () => resumeLevel(level));
-      }else if(!unlocked){
-        primary.textContent = `Gesperrt (ab ${unlockMinScore}/15)`;
-        primary.disabled = true;
-      }else{
-        primary.textContent = "Starten";
-        primary.addEventListener("click", () => startLevelNew(level));
-      }
-
-      actions.appendChild(primary);
-
-      card.appendChild(title);
-      card.appendChild(desc);
-      card.appendChild(meta);
-      card.appendChild(actions);
-
-      levelGrid.appendChild(card);
-    }
-
-    {
-      const info = document.createElement("div");
-      info.className = "card";
-      info.style.gridColumn = "1 / -1";
-      const et = (typeof eligibleTotal === "number") ? eligibleTotal : null;
-      info.innerHTML = `
-        <div class="card-title">Regeln</div>
-        <p class="card-desc" style="margin:0;">
-          Geeignete Charaktere: <strong>${et !== null ? et : "–"}</strong> (Filter: &lt; 5× "Unbekannt").<br/>
-          Freischaltung: Level n+1 wird aktiv, wenn Level n mit <strong>≥ ${unlockMinScore}/15</strong> abgeschlossen wurde.<br/>
-          Auto-Weiter: <strong>${autoAdvance ? "An" : "Aus"}</strong>
-        </p>
-      `;
-      levelGrid.appendChild(info);
-    }
+      </div>
+      <div style="display:flex;gap:10px;flex-wrap:wrap;margin-top:10px;">${primary}</div>
+    </div>`;
+  };
+
+  const RULES_CARD_TPL = (eligibleTotal) => `<div class="card" style="grid-column:1 / -1;">
+      <div class="card-title">Regeln</div>
+      <p class="card-desc" style="margin:0;">
+        Geeignete Charaktere: <strong>${eligibleTotal !== null ? eligibleTotal : "–"}</strong> (Filter: &lt; 5× "Unbekannt").<br/>
+        Freischaltung: Level n+1 wird aktiv, wenn Level n mit <strong>≥ ${unlockMinScore}/15</strong> abgeschlossen wurde.<br/>
+        Auto-Weiter: <strong data-slot="auto">${autoAdvance ? "An" : "Aus"}</strong>
+      </p>
+    </div>`;
+
+  const levelCardHtml = (level) => LEVEL_CARD_TPL(level, getBestScore(level), !!getRun(level), isLevelUnlocked(level));
+
+  // zuletzt bekannte Anzahl; renderLevels() ohne Argument behält sie bei
+  let eligibleTotalShown = null;
+  let renderLevelsPending = false;
+
+  // mehrere Aufrufe innerhalb eines Frames -> genau ein Neuaufbau
+  function renderLevels(eligibleTotal){
+    if(typeof eligibleTotal === "number") eligibleTotalShown = eligibleTotal;
+    if(renderLevelsPending) return;
+    renderLevelsPending = true;
+    requestAnimationFrame(() => {
+      renderLevelsPending = false;
+      const parts = levels.map(lv => levelCardHtml(Number(lv.level)));
+      parts.push(RULES_CARD_TPL(eligibleTotalShown));
+
+      // eine einzige DOM-Schreiboperation für das gesamte Grid
+      levelGrid.innerHTML = parts.join("");
+    });
   }
 
   function updateHUD(state){
@@ -1717,16 +2032,26 @@ HTML = r"""<!doctype html>
   }
 
   function resetQuestionUI(){
-    uiOptions.innerHTML = "";
+    uiOptions.replaceChildren();
+    uiOptions._opts = [];
     uiQuestion.textContent = "Wer ist das?";
-    quizImg.src = "";
-    quizImg.alt = "";
+    clearQuizImage();
+    clearImagePrefetches();
 
-    // Attribution UI sauber zurücksetzen (ohne Crash)
+    // Attribution UI sauber zurücksetzen (ohne Crash); offenes Idle-Update verwerfen
+    attrGen++;
     setAttribution(null);
   }
 
 
+// Quelle ist erst nach Klick sichtbar -> Befüllen darf in Leerlaufzeit laufen.
+// Ein neuerer Aufruf (oder resetQuestionUI) macht ein noch ausstehendes Update ungültig.
+let attrGen = 0;
+function setAttributionIdle(q){
+  const gen = ++attrGen;
+  onIdle(() => { if(gen === attrGen) setAttribution(q); }, 500);
+}
+
 function setAttribution(q){
   // nutze die bereits oben definierten refs
   if(!btnAttr || !attrBox) return;
@@ -1750,107 +2075,208 @@ function setAttribution(q){
   btnAttr.setAttribute("aria-expanded", "false");
 }
 
+  const OPTION_CLASS = "btn option-btn";
+
+  // von renderOptions gecachte Optionen: [{id, node, mark}] -> keine DOM-Walks/dataset-Reads danach
+  function optionNodes(){
+    return uiOptions._opts || [];
+  }
+
   function renderOptions(q){
-    uiOptions.innerHTML = "";
+    const frag = document.createDocumentFragment();
+    const opts = [];
     for(const o of (q.options || [])){
       const b = document.createElement("button");
       b.type = "button";
-      b.className = "btn option-btn";
+      b.className = OPTION_CLASS;
       b.dataset.id = o.id;
-      b.innerHTML = `<span>${escapeHtml(o.text)}</span><span class="mark" aria-hidden="true"></span>`;
+      // Spans direkt erzeugen: kein HTML-Parsing/Escaping pro Option
+      const label = document.createElement("span");
+      label.textContent = o.text;
+      const mark = document.createElement("span");
+      mark.className = "mark";
+      mark.setAttribute("aria-hidden", "true");
+      b.append(label, mark);
 
       if(q.answered){
         b.disabled = true;
       }else{
         // nur die aktuelle offene Frage darf beantwortet werden
-        const isAnswerable = (viewPos === nextPos);
-        b.disabled = !isAnswerable;
-        if(isAnswerable){
-          b.addEventListener("click", () => chooseAnswer(o.id));
-        }
+        b.disabled = (viewPos !== nextPos);
       }
-      uiOptions.appendChild(b);
+      frag.appendChild(b);
+      opts.push({id: String(o.id), node: b, mark});
     }
-  }
-
-  function markButton(id, kind, mark){
-    const btn = uiOptions.querySelector(`button[data-id="${CSS.escape(id)}"]`);
-    if(!btn) return;
-    btn.classList.remove("ok","bad","dim");
-    if(kind) btn.classList.add(kind);
-    const m = btn.querySelector(".mark");
-    if(m) m.textContent = mark || "";
+    uiOptions._opts = opts;
+    uiOptions.replaceChildren(frag);
   }
 
   function lockOptions(){
-    uiOptions.querySelectorAll("button").forEach(b => b.disabled = true);
-  }
-
-  function dimWrongExcept(correctId, keepId){
-    uiOptions.querySelectorAll("button").forEach(b => {
-      const id = b.dataset.id;
-      if(id !== correctId && id !== keepId){
-        b.classList.add("dim");
-      }
-    });
+    for(const o of optionNodes()) o.node.disabled = true;
   }
 
   function applyAnsweredStyling(q){
     if(!q.answered) return;
 
-    lockOptions();
-
     const selected = q.selected_id;
     const correctId = q.correct_id;
-
-    // Reset classes
-    uiOptions.querySelectorAll("button").forEach(b => {
-      b.classList.remove("ok","bad","dim","fade-out");
-      b.style.display = "";
-    });
-
-    if(selected && correctId){
-      if(selected === correctId){
-        markButton(correctId, "ok", "✓");
-      }else{
-        markButton(selected, "bad", "✕");
-        markButton(correctId, "ok", "✓");
+    const marked = !!(selected && correctId);
+
+    // Zielzustand je Option einmal berechnen und mit einem className-Write setzen
+    for(const {id, node: b, mark: m} of optionNodes()){
+      let cls = OPTION_CLASS;
+      let mark = "";
+      if(marked && id === correctId){
+        cls += " ok";
+        mark = "✓";
+      }else if(marked && id === selected){
+        cls += " bad";
+        mark = "✕";
       }
+      b.className = cls;
+      b.disabled = true;
+      if(m) m.textContent = mark;
     }
   }
 
+  // Erst alle Entscheidungen lesen, dann gesammelt in einem Frame schreiben
+  function optionDecisions(keep){
+    return optionNodes().map(o => ({b: o.node, keep: keep.has(o.id)}));
+  }
+
   function hideWrongInstant(correctId){
-    uiOptions.querySelectorAll("button").forEach(b => {
-      const id = b.dataset.id;
-      b.classList.remove("fade-out");
-      b.style.display = (id === correctId) ? "" : "none";
+    const decisions = optionDecisions(new Set([String(correctId || "")]));
+    requestAnimationFrame(() => {
+      for(const {b, keep} of decisions){
+        if(b.classList.contains("fade-out")) b.classList.remove("fade-out");
+        b.classList.toggle("hidden", !keep);
+      }
     });
   }
 
+  const FADE_FALLBACK_MS = 500; // > .22s-Transition von .option-btn
+
   function fadeOutAndHideWrong(correctId, keepAlsoId){
     const keep = new Set([String(correctId || "")]);
     if(keepAlsoId) keep.add(String(keepAlsoId));
 
-    const wrong = [];
-    uiOptions.querySelectorAll("button").forEach(b => {
-      const id = String(b.dataset.id || "");
-      b.classList.remove("fade-out");
-      if(!keep.has(id)){
-        wrong.push(b);
+    const decisions = optionDecisions(keep);
+    requestAnimationFrame(() => {
+      for(const {b, keep} of decisions){
+        if(b.classList.contains("hidden")) b.classList.remove("hidden");
+        if(keep){
+          if(b.classList.contains("fade-out")) b.classList.remove("fade-out");
+          continue;
+        }
+        // Aufräumen, sobald die Transition fertig ist; der Timer greift nur, wenn transitionend
+        // ausbleibt (Knoten entfernt, Tab im Hintergrund)
+        let fallback = 0;
+        const hide = () => {
+          clearTimeout(fallback);
+          b.removeEventListener("transitionend", hide);
+          b.classList.add("hidden");
+        };
+        b.addEventListener("transitionend", hide, {once: true});
+        fallback = setTimeout(hide, FADE_FALLBACK_MS);
         b.classList.add("fade-out");
-      }else{
-        b.style.display = "";
       }
     });
-    setTimeout(() => {
-      wrong.forEach(b => { b.style.display = "none"; });
-    }, 280);
   }
 
-async function loadQuestion(pos){
+  // Spekulative Requests nur bei brauchbarer Verbindung (Network Information API, falls vorhanden)
+  const netInfo = navigator.connection || navigator.mozConnection || navigator.webkitConnection || null;
+  const SLOW_NET_TYPES = ["slow-2g", "2g", "3g"];
+  let prefetchAllowed = true;
+  function updatePrefetchAllowed(){
+    prefetchAllowed = !netInfo || (!netInfo.saveData && !SLOW_NET_TYPES.includes(netInfo.effectiveType));
+  }
+  updatePrefetchAllowed();
+  if(netInfo && netInfo.addEventListener) netInfo.addEventListener("change", updatePrefetchAllowed);
+  function shouldPrefetch(){
+    return prefetchAllowed;
+  }
+
+  // Ein wiederverwendeter Preloader: Bild erst dekodieren, dann ins sichtbare <img> tauschen.
+  // Die Generation verwirft Tausch-Aufträge, die inzwischen überholt sind.
+  const imgLoader = new Image();
+  imgLoader.decoding = "async";
+  imgLoader.fetchPriority = "high"; // lädt jetzt das LCP-Bild, nicht mehr #quizImg selbst
+  let imgSwapGen = 0;
+  function showQuizImage(url){
+    const gen = ++imgSwapGen;
+    const swap = () => {
+      if(gen !== imgSwapGen) return;
+      quizImg.src = url;
+      quizImg.alt = "Quiz-Bild";
+    };
+    imgLoader.src = url;
+    if(typeof imgLoader.decode === "function") imgLoader.decode().then(swap, swap);
+    else swap();
+  }
+  function clearQuizImage(){
+    imgSwapGen++;
+    // src entfernen statt "" setzen: leeres src löst in manchen Browsern einen Request aus
+    imgLoader.removeAttribute("src");
+    quizImg.removeAttribute("src");
+    quizImg.alt = "";
+  }
+
+  // Bild der nächsten Frage per rel=prefetch (niedrigste Priorität, verwerfbar) vorladen.
+  // url -> <link>, damit dieselbe URL nicht doppelt angehängt wird
+  const imagePrefetches = new Map();
+  function preloadNextImage(url){
+    if(!url || imagePrefetches.has(url) || !shouldPrefetch()) return;
+    const link = document.createElement("link");
+    link.rel = "prefetch";
+    link.as = "image";
+    link.href = url;
+    document.head.appendChild(link);
+    imagePrefetches.set(url, link);
+  }
+  function clearImagePrefetches(){
+    for(const link of imagePrefetches.values()) link.remove();
+    imagePrefetches.clear();
+  }
+
+  // spekulativ geladene Folgefrage (während der 4s-Anzeige); gilt nur für exakt diesen Run-Stand
+  let prefetchedQuestion = null; // {pos, run, promise}
+  function prefetchQuestion(pos){
+    if(!shouldPrefetch()) return;
+    const promise = apiPost("/api/run/question", {run: runToken, pos});
+    promise.catch(() => {}); // verworfene Prefetches nicht als unhandled rejection melden
+    prefetchedQuestion = {pos, run: runToken, promise};
+  }
+  function takePrefetched(pos){
+    const p = prefetchedQuestion;
+    prefetchedQuestion = null;
+    return (p && p.pos === pos && p.run === runToken) ? p.promise : null;
+  }
+
+  // Navigation zusammenfassen: solange eine Frage lädt, liefern weitere Aufrufe denselben Promise
+  // Wiederverwendet wird nur ein Ladevorgang für dieselbe Position im selben Run.
+  let pendingLoad = null; // {pos, run, promise}
+  let loadSeq = 0;
+  function loadQuestion(pos, prefetched){
+    if(pendingLoad && pendingLoad.pos === pos && pendingLoad.run === runToken) return pendingLoad.promise;
+    const entry = {pos, run: runToken, promise: null};
+    entry.promise = loadQuestionNow(pos, prefetched, ++loadSeq).finally(() => {
+      if(pendingLoad === entry) pendingLoad = null;
+    });
+    pendingLoad = entry;
+    return entry.promise;
+  }
+
+async function loadQuestionNow(pos, prefetched, seq){
   resetQuestionUI();
+  const run = runToken;
+  const level = currentLevel;
+  // überholt (neuerer Ladevorgang, Levelwechsel, neuer Run) -> Ergebnis verwerfen
+  const stale = () => seq !== loadSeq || currentLevel !== level || runToken !== run;
   try{
-    const res = await api("POST", "/api/run/question", {run: runToken, pos});
+    const fetchQ = () => apiPost("/api/run/question", {run, pos});
+    // fehlgeschlagener Prefetch -> normal nachladen
+    const res = prefetched ? await prefetched.catch(fetchQ) : await fetchQ();
+    if(stale()) return;
     runToken = res.updated_run;
     setRun(currentLevel, runToken);
 
@@ -1860,11 +2286,11 @@ async function loadQuestion(pos){
     if(!q) throw new Error("Frage ist leer (res.question).");
 
     // Quelle immer setzen (auch vor Beantwortung)
-    setAttribution(q);
+    setAttributionIdle(q);
 
-    quizImg.src = q.image_url;
-    quizImg.alt = "Quiz-Bild";
+    showQuizImage(q.image_url);
     renderOptions(q);
+    preloadNextImage(q.next_image_url);
 
     // Next-Button logik: erst nach renderOptions/answered
     btnNext.disabled = (!q.answered && viewPos === nextPos);
@@ -1876,6 +2302,7 @@ async function loadQuestion(pos){
       if(q.correct_id) hideWrongInstant(q.correct_id);
     }
   }catch(e){
+    if(stale()) return;
     toastMsg("Fehler", e.message || "Frage konnte nicht geladen werden.");
     showError(e.message || "Frage konnte nicht geladen werden.");
   }
@@ -1899,7 +2326,7 @@ async function loadQuestion(pos){
     btnBackToLevels.disabled = true;
     if(btnAuto) btnAuto.disabled = true;
 
-    const answerPromise = api("POST", "/api/run/answer", {run: runToken, pos: viewPos, choice_id: choiceId});
+    const answerPromise = apiPost("/api/run/answer", {run: runToken, pos: viewPos, choice_id: choiceId}, true);
 
     try{
       const res = await playCountdownAndVerdictFromPromise(answerPromise, (res) => {
@@ -1909,10 +2336,16 @@ async function loadQuestion(pos){
         updateHUD(res.state);
         const q = res.question;
 
+        // Folgefrage + Bild schon während Verdict/Anzeige laden
+        if(!res.done){
+          prefetchQuestion(Math.min(nextPos, viewPos + 1));
+          preloadNextImage(q.next_image_url);
+        }
+
         // answered UI im Hintergrund setzen (Overlay ist sichtbar)
         renderOptions(q);
         applyAnsweredStyling(q);
-        setAttribution(q);
+        setAttributionIdle(q);
 
         // Navigation während Countdown/Verdict + Reveal sperren
         btnPrev.disabled = true;
@@ -1948,7 +2381,7 @@ async function loadQuestion(pos){
         btnNext.textContent = "Weiter…";
         btnNext.disabled = true;
 
-        await loadQuestion(target);
+        await loadQuestion(target, takePrefetched(target));
 
         btnNext.textContent = "Weiter";
         btnBackToLevels.disabled = false;
@@ -1982,25 +2415,42 @@ async function loadQuestion(pos){
     setBestScore(currentLevel, Number(summary.score || 0));
     clearRun(currentLevel);
 
-    const secs = Number(summary.duration_s || 0);
-    const mm = Math.floor(secs / 60);
-    const ss = secs % 60;
-
-    const sc = Number(summary.score || 0);
-    const correct = Number(summary.correct_n || 0);
-    const acc = Number(summary.accuracy || 0);
-
-    resultText.innerHTML = `
-      <strong>Level ${summary.level}</strong><br/>
-      Score: <strong>${sc}</strong> / 15<br/>
-      Richtig: <strong>${correct}</strong><br/>
-      Trefferquote: <strong>${Math.round(acc*100)}%</strong><br/>
-      Zeit: <strong>${mm}:${String(ss).padStart(2,"0")}</strong>
-    `;
+    // Ergebnis-Gerüst steht im HTML; nur die Werte per textContent setzen
+    const secs = summary.duration_s | 0;
+    rtLevel.textContent = summary.level | 0;
+    rtScore.textContent = summary.score | 0;
+    rtCorrect.textContent = summary.correct_n | 0;
+    rtAcc.textContent = `${Math.round(Number(summary.accuracy || 0) * 100)}%`;
+    rtTime.textContent = `${(secs / 60) | 0}:${("" + (secs % 60)).padStart(2, "0")}`;
 
     showResult();
-    renderLevels();
     toastMsg("Run beendet", "Zurück zur Level-Auswahl.");
+
+    // während der Nutzer das Ergebnis liest: Wiederholung und nächstes Level vorab starten
+    const level = currentLevel;
+    onIdle(() => {
+      prefetchStart(level);
+      const nxt = level + 1;
+      if(levels.some(lv => Number(lv.level) === nxt) && isLevelUnlocked(nxt)) prefetchStart(nxt);
+    }, 1500);
+  }
+
+  // spekulativ gestartete Runs: level -> {ts, promise}. Die Laufzeit zählt der Server
+  // erst ab dem Laden der ersten Frage; die TTL hält nur vergessene Starts klein.
+  const START_PREFETCH_TTL_MS = 30 * 1000;
+  const startPrefetches = new Map();
+  const startPrefetchFresh = (e) => !!e && Date.now() - e.ts < START_PREFETCH_TTL_MS;
+  function prefetchStart(level){
+    // abgelaufene Einträge werden ersetzt, nicht als "schon vorgestartet" gewertet
+    if(startPrefetchFresh(startPrefetches.get(level)) || !shouldPrefetch()) return;
+    const promise = apiPost("/api/run/start", {level});
+    promise.catch(() => {}); // ungenutzt -> Token verfällt einfach
+    startPrefetches.set(level, {ts: Date.now(), promise});
+  }
+  function takeStartPrefetch(level){
+    const e = startPrefetches.get(level);
+    startPrefetches.delete(level);
+    return startPrefetchFresh(e) ? e.promise : null;
   }
 
   async function startLevelNew(level){
@@ -2009,7 +2459,9 @@ async function loadQuestion(pos){
     currentLevel = level;
     showQuiz();
     try{
-      const res = await api("POST", "/api/run/start", {level});
+      const fetchStart = () => apiPost("/api/run/start", {level});
+      const prefetched = takeStartPrefetch(level);
+      const res = prefetched ? await prefetched.catch(fetchStart) : await fetchStart();
       runToken = res.run;
       setRun(level, runToken);
 
@@ -2033,7 +2485,7 @@ async function loadQuestion(pos){
     currentLevel = level;
     showQuiz();
     try{
-      const res = await api("POST", "/api/run/resume", {run: saved});
+      const res = await apiPost("/api/run/resume", {run: saved});
       runToken = res.updated_run;
       setRun(level, runToken);
 
@@ -2061,25 +2513,39 @@ async function loadQuestion(pos){
       cancelAutoAdvance();
       setAutoAdvance(!autoAdvance);
       toastMsg("Auto-Weiter", autoAdvance ? "Aktiv" : "Deaktiviert");
-      renderLevels();
+      // nur die Anzeige in der Regeln-Karte hängt davon ab
+      const slot = levelGrid.querySelector('[data-slot="auto"]');
+      if(slot) slot.textContent = autoAdvance ? "An" : "Aus";
     });
   }
 
+  // Prev/Next sofort sperren, bis die Frage geladen ist (kein Klick-Stau)
+  async function navigateTo(pos, prefetched){
+    btnPrev.disabled = true;
+    btnNext.disabled = true;
+    try{
+      await loadQuestion(pos, prefetched);
+    }finally{
+      btnPrev.disabled = (viewPos <= 0);
+      btnNext.disabled = (viewPos === nextPos);
+    }
+  }
+
   btnPrev.addEventListener("click", async () => {
     cancelAutoAdvance();
-    if(viewPos <= 0) return;
-    await loadQuestion(viewPos - 1);
+    if(viewPos <= 0 || pendingLoad) return;
+    await navigateTo(viewPos - 1);
   });
 
   btnNext.addEventListener("click", async () => {
     cancelAutoAdvance();
     // Wenn aktuell unbeantwortet und "next", dann block
-    if(viewPos === nextPos){
-      // unbeantwortet
+    if(viewPos === nextPos || pendingLoad){
+      // unbeantwortet bzw. Laden läuft noch
       return;
     }
     const newPos = Math.min(nextPos, viewPos + 1);
-    await loadQuestion(newPos);
+    await navigateTo(newPos, takePrefetched(newPos));
   });
 
 
@@ -2100,64 +2566,161 @@ async function loadQuestion(pos){
     toastMsg("Fortschritt gespeichert", "Du kannst jederzeit fortsetzen.");
   });
 
+  // delegierte Listener: einmalig registriert, unabhängig von der Anzahl Karten/Optionen
+  levelGrid.addEventListener("click", (e) => {
+    const b = e.target.closest("button[data-action][data-level]");
+    if(!b || b.disabled) return;
+    const level = Number(b.dataset.level);
+    if(b.dataset.action === "resume") resumeLevel(level);
+    else startLevelNew(level);
+  });
+
+  uiOptions.addEventListener("click", (e) => {
+    const b = e.target.closest("button[data-id]");
+    if(!b || b.disabled) return;
+    chooseAnswer(b.dataset.id);
+  });
+
   btnAgain.addEventListener("click", () => startLevelNew(currentLevel));
   btnResultBack.addEventListener("click", () => { renderLevels(); showLevels(); });
 
+  function announceSavedRun(){
+    // Falls ein Run existiert -> Hinweis
+    const anyRunLevel = levels.map(x => Number(x.level)).find(lv => !!getRun(lv));
+    if(anyRunLevel){
+      toastMsg("Run gefunden", `Level ${anyRunLevel} kann fortgesetzt werden.`);
+    }
+  }
+
   // init
   (async () => {
+    // Stale-while-revalidate: gecachte Levels sofort zeigen, das Netz aktualisiert im Hintergrund
+    const cached = readStore(LEVELS_KEY);
+    const fromCache = Array.isArray(cached.levels) && cached.levels.length > 0
+      && (Date.now() - Number(cached.ts || 0)) < LEVELS_CACHE_MAX_AGE_MS;
+    if(fromCache){
+      levels = cached.levels;
+      renderLevels(cached.eligible_total);
+      showLevels();
+      announceSavedRun();
+    }
+
     try{
-      const res = await api("GET", "/api/levels");
-      levels = res.levels || [];
-      if(!levels.length) throw new Error("Keine Levels verfügbar.");
+      const res = await apiGet("/api/levels");
+      const fresh = res.levels || [];
+      if(!fresh.length) throw new Error("Keine Levels verfügbar.");
+      scheduleWrite(LEVELS_KEY, {levels: fresh, eligible_total: res.eligible_total, ts: Date.now()});
 
-      renderLevels(res.eligible_total);
-      showLevels();
+      const changed = !fromCache
+        || res.eligible_total !== cached.eligible_total
+        || JSON.stringify(fresh) !== JSON.stringify(cached.levels);
+      if(!changed) return;
 
-      // Falls ein Run existiert -> Hinweis
-      const anyRunLevel = levels.map(x => Number(x.level)).find(lv => !!getRun(lv));
-      if(anyRunLevel){
-        toastMsg("Run gefunden", `Level ${anyRunLevel} kann fortgesetzt werden.`);
+      levels = fresh;
+      renderLevels(res.eligible_total);
+      if(!fromCache){
+        // beim Cache-Treffer läuft evtl. schon ein Quiz -> Ansicht nicht wechseln
+        showLevels();
+        announceSavedRun();
       }
     }catch(e){
+      // mit Cache bleibt die bisherige Ansicht einfach stehen
+      if(fromCache) return;
       showError(e.message || "Quizdaten konnten nicht geladen werden.");
       showLevels();
     }
   })();
 
 })();
-</script>
-</body>
-</html>
 """
 
 
+# bevorzugte Reihenfolge der vorkomprimierten Varianten
+PRECOMPRESSED_ENCODINGS = ("br", "gzip")
+
+
+def _precompress(data: bytes) -> Dict[str, bytes]:
+    """Einmalig beim Import: identity + gzip (+ br, falls brotli installiert)."""
+    variants = {"identity": data, "gzip": gzip.compress(data, 9)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)
+    return variants
+
+
+def _send_precompressed(variants: Dict[str, bytes], etag: str, mimetype: str, cache_control: str) -> Response:
+    """Vorkomprimierte Variante passend zu Accept-Encoding senden (inkl. 304)."""
+    enc = next((e for e in PRECOMPRESSED_ENCODINGS if e in variants and request.accept_encodings.quality(e) > 0), "identity")
+    tag = etag if enc == "identity" else f"{etag}-{enc}"
+    if request.if_none_match.contains(tag):
+        resp = Response(status=304)
+    else:
+        resp = Response(variants[enc], mimetype=mimetype)
+        if enc != "identity":
+            resp.headers["Content-Encoding"] = enc
+    resp.set_etag(tag)
+    resp.headers["Cache-Control"] = cache_control
+    resp.vary.add("Accept-Encoding")
+    return resp
+
+
+# name -> (Varianten, mimetype); Name enthält den Content-Hash
+STATIC_ASSETS: Dict[str, Tuple[Dict[str, bytes], str]] = {}
+
+
+def _register_asset(stem: str, ext: str, text: str) -> str:
+    data = text.encode("utf-8")
+    name = f"{stem}.{_sha256_hex(data)[:10]}.{ext}"
+    STATIC_ASSETS[name] = (_precompress(data), _guess_mime("." + ext))
+    return f"/static/{name}"
+
+
+CSS_HREF = _register_asset("app", "css", CSS)
+JS_HREF = _register_asset("app", "js", JS)
+
+# einmal kompilieren; render_template_string würde HTML pro Request neu parsen
+_INDEX_TEMPLATE = app.jinja_env.from_string(HTML)
+
+
+@app.get("/static/<name>")
+def static_asset(name: str):
+    asset = STATIC_ASSETS.get(name)
+    if asset is None:
+        return jsonify({"ok": False, "error": "not_found"}), 404
+    variants, mime = asset
+    # Name ist bereits der Content-Hash -> taugt direkt als ETag
+    return _send_precompressed(variants, name, mime, f"public, max-age={STATIC_MAX_AGE_S}, immutable")
+
+
+# Alle Template-Variablen sind pro Deployment statisch -> genau einmal rendern
+_INDEX_HTML = _INDEX_TEMPLATE.render(
+    page_title=SERVICE_META["page_title"],
+    page_h1=SERVICE_META["page_h1"],
+    page_subtitle=SERVICE_META["page_subtitle"],
+    landing_url=LANDING_URL,
+    css_href=CSS_HREF,
+    js_href=JS_HREF,
+).encode("utf-8")
+_INDEX_VARIANTS = _precompress(_INDEX_HTML)
+_INDEX_ETAG = hashlib.blake2b(_INDEX_HTML, digest_size=12).hexdigest()
+# Preload-Hints schon im Header; ein Proxy (z.B. nginx) kann daraus 103 Early Hints machen
+_INDEX_LINK = ", ".join((
+    f"<{CSS_HREF}>; rel=preload; as=style",
+    f"<{JS_HREF}>; rel=preload; as=script",
+    "</api/levels>; rel=preload; as=fetch; crossorigin",
+))
+
+
 @app.get("/")
-def index() -> str:
+def index() -> Response:
     try:
-        # Validate once
+        # Datenset früh laden; Fehler meldet das Frontend über /api/levels
         _ = get_levels()
-        return render_template_string(
-            HTML,
-            page_title=SERVICE_META["page_title"],
-            page_h1=SERVICE_META["page_h1"],
-            page_subtitle=SERVICE_META["page_subtitle"],
-            landing_url=LANDING_URL,
-            services=SERVICES,
-        )
     except Exception:
-        msg = (
-            "Datenset konnte nicht geladen werden. "
-            "Prüfe, ob 'out_pawpatrol_characters/characters_de.json' und die Bilder im Repo vorhanden sind "
-            "oder setze DATA_JSON_PATH/DATA_BASE_DIR korrekt."
-        )
-        return render_template_string(
-            HTML,
-            page_title=SERVICE_META["page_title"],
-            page_h1=SERVICE_META["page_h1"],
-            page_subtitle=SERVICE_META["page_subtitle"],
-            landing_url=LANDING_URL,
-            services=SERVICES,
-        )
+        pass
+    # HTML-Shell immer revalidieren (ETag -> günstige 304), damit Shell und Asset-Hashes zusammenpassen
+    resp = _send_precompressed(_INDEX_VARIANTS, _INDEX_ETAG, "text/html", "no-cache")
+    resp.headers["Link"] = _INDEX_LINK
+    return resp
 
 
 if __name__ == "__main__":